@@ -0,0 +1,70 @@
+"""
+Broadphase benchmark for Space Fighter game.
+
+Compares the old per-bullet `spritecollide` scan against the uniform-grid
+SpatialHash for growing numbers of bullets and enemies spread over the
+playfield. Run from the project root:
+
+    python benchmarks/bench_spatial_hash.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pygame
+import settings
+from src.utils.spatial_hash import SpatialHash
+
+
+class Box(pygame.sprite.Sprite):
+    """Minimal sprite carrying only a rect, standing in for bullets and enemies."""
+    def __init__(self, rng, size):
+        super().__init__()
+        self.rect = pygame.Rect(0, 0, size, size)
+        self.rect.center = (rng.uniform(0, settings.SCREEN_SIZE[0]), rng.uniform(0, settings.SCREEN_SIZE[1]))
+
+
+def naive(bullets, enemies):
+    hits = 0
+    for bullet in bullets:
+        hits += len(pygame.sprite.spritecollide(bullet, enemies, False))
+    return hits
+
+
+def hashed(bullets, enemies, grid):
+    grid.rebuild(enemies)
+    hits = 0
+    for bullet in bullets:
+        for enemy in grid.query(bullet.rect):
+            if bullet.rect.colliderect(enemy.rect):
+                hits += 1
+    return hits
+
+
+def best_of(repeats, func, *args):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    rng = random.Random(1234)
+    grid = SpatialHash()
+    print(f"{'entities':>10} {'naive ms':>10} {'grid ms':>10} {'speedup':>8}")
+    for count in (100, 500, 1000, 2000, 5000):
+        bullets = pygame.sprite.Group(Box(rng, 20) for _ in range(count))
+        enemies = pygame.sprite.Group(Box(rng, 30) for _ in range(count))
+        repeats = 3 if count <= 1000 else 1
+        naive_time, naive_hits = best_of(repeats, naive, bullets, enemies)
+        grid_time, grid_hits = best_of(repeats, hashed, bullets, enemies, grid)
+        assert naive_hits == grid_hits, (naive_hits, grid_hits)
+        print(f"{count:>10} {naive_time * 1000:>10.2f} {grid_time * 1000:>10.2f} {naive_time / grid_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
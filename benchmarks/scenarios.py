@@ -0,0 +1,302 @@
+"""
+Scenario benchmark suite for Space Fighter game.
+
+Runs scripted stress scenarios against a headless `Game` (SDL dummy drivers,
+fixed simulation step, every frame drawn) and reports per-subsystem frame
+time percentiles, allocated-block growth per frame, garbage collector
+activity, object pool reuse and entity counts as JSON, so runs from
+different versions can be compared. Block growth is net, so a frame that
+allocates and frees the same objects reads as zero; the collector figures
+and pool counters show that churn. Run from the project root:
+
+    python benchmarks/scenarios.py --frames 600 --output results.json
+    python benchmarks/scenarios.py --scenario chasers_500 --scenario menu_idle
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import numpy as np
+import pygame
+import settings
+from main import Game
+from src.entities.enemy import damage_indicators, spawn
+from src.entities.particles import effects
+from src.entities.spawner import Spawner, SpawnRule
+import src.entities.weapons as weapons
+import src.utils.upgrades as upgrades
+from src.utils.input import InputState, ScriptedInput
+from src.utils.pool import pool_stats
+
+FIRE_UP = InputState(mouse_pos=(settings.SCREEN_SIZE[0] // 2, 0), mouse_buttons=(True, False, False))
+IDLE = InputState()
+
+
+def _spawn(game, name, x, y):
+    enemy = spawn(name, settings.SCREEN_SIZE[0], game.player, game.difficulty, 1, game.rng)
+    enemy.position.update(x, y)
+    enemy.rect.center = enemy.position
+    game.enemies.add(enemy)
+
+
+def _endless(game):
+    """Keep the game running: no deaths, no level-up menu, no random spawns."""
+    game.player.lives = 10**9
+    game.level = 10**6
+    game.spawner = Spawner([])
+
+
+def _max_fire_rate(game, weapon_cls):
+    game.player.weapon = weapon_cls(game.sim_clock, game.rng)
+    game.player.upgrades["fire_rate"] = settings.UPGRADES["fire_rate"]["levels"]
+
+
+def chasers(count):
+    """`count` chasers spread above and across the playfield."""
+    def setup(game, rng):
+        _endless(game)
+        width, height = settings.SCREEN_SIZE
+        for _ in range(count):
+            _spawn(game, "chaser", rng.uniform(0, width), rng.uniform(-height, height / 2))
+        return FIRE_UP, None
+    return setup
+
+
+def laser_fire(game, rng):
+    """Continuous max fire-rate laser into a steady stream of chasers."""
+    _endless(game)
+    _max_fire_rate(game, weapons.Weapon_laser)
+    game.spawner = Spawner([SpawnRule("chaser", 100)])
+    game.spawner.start_level(1, game.sim_clock.get_ticks())
+    return FIRE_UP, None
+
+
+def shotgun_waves(game, rng):
+    """Max fire-rate shotgun into dense waves of fallers."""
+    _endless(game)
+    _max_fire_rate(game, weapons.Weapon_shotgun)
+    width = settings.SCREEN_SIZE[0]
+
+    def wave(game, frame):
+        if frame % 30 == 0:
+            for i in range(25):
+                _spawn(game, "faller", 30 + i * (width - 60) / 24, -30)
+    return FIRE_UP, wave
+
+
+def menu_idle(game, rng):
+    """The main menu with nobody touching anything."""
+    game.state = settings.MENU
+    return IDLE, None
+
+
+def upgrade_overlay_idle(game, rng):
+    """The upgrade overlay open, with the mouse hovering the first choice."""
+    _endless(game)
+    game.upgrade_menu_active = True
+    choices = upgrades.upgrade_choices(game.rng)
+    return InputState(mouse_pos=upgrades.choice_rects(choices)[0].center), None
+
+
+SCENARIOS = {
+    "chasers_500": chasers(500),
+    "chasers_5000": chasers(5000),
+    "laser_fire": laser_fire,
+    "shotgun_waves": shotgun_waves,
+    "menu_idle": menu_idle,
+    "upgrade_overlay_idle": upgrade_overlay_idle,
+}
+
+
+class FrameTimer:
+    """Accumulates time spent in wrapped methods into the current frame's sample."""
+    def __init__(self):
+        self.current = {}
+        self.wrapped = []
+
+    def wrap(self, obj, method, name):
+        """Replace `obj.method` with a timed wrapper on that instance only."""
+        self.wrapped.append((obj, method))
+        original = getattr(obj, method)
+        current = self.current
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                current[name] = current.get(name, 0.0) + time.perf_counter() - start
+        setattr(obj, method, timed)
+
+    def unwrap(self):
+        """Restore every wrapped method."""
+        for obj, method in self.wrapped:
+            delattr(obj, method)
+        self.wrapped.clear()
+
+
+def percentiles(samples):
+    """Return p50/p95/p99/mean/max of a list of milliseconds."""
+    values = np.asarray(samples, dtype=float)
+    p50, p95, p99 = np.percentile(values, (50, 95, 99))
+    return {"p50": p50, "p95": p95, "p99": p99, "mean": values.mean(), "max": values.max()}
+
+
+def pool_usage(before, after):
+    """Return each pool's hits, misses and hit rate between two `pool_stats()` snapshots, and its sizes after."""
+    usage = {}
+    for name, stats in after.items():
+        start = before.get(name, {"hits": 0, "misses": 0})
+        hits = stats["hits"] - start["hits"]
+        misses = stats["misses"] - start["misses"]
+        usage[name] = {"hits": hits, "misses": misses, "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                       "live": stats["live"], "free": stats["free"]}
+    return usage
+
+
+class GcMonitor:
+    """Counts garbage collections and the time spent in them, per generation."""
+    def __init__(self):
+        self.collections = [0] * len(gc.get_stats())
+        self.ms = 0.0
+        self.started = None
+
+    def __call__(self, phase, info):
+        """Record one `gc.callbacks` event."""
+        if phase == "start":
+            self.started = time.perf_counter()
+        elif self.started is not None:
+            self.collections[info["generation"]] += 1
+            self.ms += (time.perf_counter() - self.started) * 1000
+            self.started = None
+
+    def reset(self):
+        """Forget everything counted so far."""
+        self.collections = [0] * len(self.collections)
+        self.ms = 0.0
+
+    def results(self):
+        """Return the collections per generation and their total time in ms."""
+        return {"collections": {f"gen{generation}": count for generation, count in enumerate(self.collections)},
+                "ms": self.ms}
+
+
+def run_scenario(game, setup, frames, warmup, seed):
+    """
+    Run one scenario and collect its measurements.
+
+    Returns:
+        dict: Frame and subsystem timings in ms, allocations, garbage collections,
+            pool reuse and entity counts.
+    """
+    game.start(settings.NORMAL, seed)
+    damage_indicators.clear()
+    state, tick = setup(game, random.Random(seed))
+    game.input_source = ScriptedInput(lambda game: state)
+
+    timer = FrameTimer()
+    timer.wrap(game, "update", "update")
+    timer.wrap(game, "draw", "render")
+    timer.wrap(game.steering, "update", "enemies")
+    timer.wrap(game.player.projectiles, "update", "projectiles")
+    timer.wrap(damage_indicators, "update", "effects")
+    timer.wrap(effects, "update", "particles")
+    timer.wrap(effects, "draw", "particles_draw")
+    timer.wrap(game, "check_projectile_collisions", "collisions")
+    timer.wrap(game, "check_player_collision", "player_collision")
+
+    subsystems = {}
+    frame_ms = []
+    blocks = []
+    counts = {"enemies": [], "projectiles": [], "effects": [], "particles": []}
+    collector = GcMonitor()
+    gc.callbacks.append(collector)
+    try:
+        for frame in range(warmup + frames):
+            if frame == warmup:
+                pools_before = pool_stats()
+                collector.reset()
+            if tick is not None:
+                tick(game, frame)
+            timer.current.clear()
+            blocks_before = sys.getallocatedblocks()
+            start = time.perf_counter()
+            game.step()
+            game.draw()
+            elapsed = time.perf_counter() - start
+            if frame < warmup:
+                continue
+            blocks.append(sys.getallocatedblocks() - blocks_before)
+            frame_ms.append(elapsed * 1000)
+            for name, seconds in timer.current.items():
+                subsystems.setdefault(name, []).append(seconds * 1000)
+            counts["enemies"].append(len(game.enemies))
+            counts["projectiles"].append(len(game.player.projectiles))
+            counts["effects"].append(len(damage_indicators))
+            counts["particles"].append(len(effects))
+    finally:
+        gc.callbacks.remove(collector)
+        timer.unwrap()
+
+    return {
+        "frames": frames,
+        "frame_ms": percentiles(frame_ms),
+        "subsystems_ms": {name: percentiles(samples) for name, samples in subsystems.items()},
+        "allocated_blocks_per_frame": percentiles(blocks),
+        "gc": collector.results(),
+        "pools": pool_usage(pools_before, pool_stats()),
+        "entities": {name: {"mean": float(np.mean(values)), "max": int(max(values))} for name, values in counts.items()},
+    }
+
+
+def metadata():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the scenario benchmarks and print JSON results.")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, help="run only these (repeatable)")
+    parser.add_argument("--frames", type=int, default=600, help="measured frames per scenario")
+    parser.add_argument("--warmup", type=int, default=60, help="unmeasured frames before measuring")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    game = Game(headless=True)
+    results = {"meta": metadata(), "frames": args.frames, "warmup": args.warmup, "seed": args.seed, "scenarios": {}}
+    for name in args.scenario or SCENARIOS:
+        results["scenarios"][name] = run_scenario(game, SCENARIOS[name], args.frames, args.warmup, args.seed)
+        print(f"{name}: p50 {results['scenarios'][name]['frame_ms']['p50']:.2f} ms", file=sys.stderr)
+
+    text = json.dumps(results, indent=2, default=float)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
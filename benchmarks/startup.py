@@ -0,0 +1,69 @@
+"""
+Startup benchmark for Space Fighter game.
+
+Launches the game in fresh interpreters (SDL dummy drivers, real loading
+path) and reports how long importing, loading assets and reaching the first
+menu frame took, as JSON. Exits with status 1 if the median time to the first
+frame is over STARTUP_BUDGET. Run from the project root:
+
+    python benchmarks/startup.py --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import settings
+
+# Runs in the child: import the game, open the window and draw the first menu frame
+CHILD = """
+import json, time
+import main
+imported = time.perf_counter()
+game = main.Game()
+game.step()
+game.draw()
+print(json.dumps({
+    "import_ms": (imported - main.STARTED) * 1000,
+    "load_ms": game.load_ms,
+    "first_frame_ms": game.first_frame_ms,
+}))
+"""
+
+
+def launch():
+    """Start the game once in a new interpreter and return its timings."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD], cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure time from launch to the first menu frame.")
+    parser.add_argument("--runs", type=int, default=5, help="launches to measure")
+    parser.add_argument("--budget", type=float, default=settings.STARTUP_BUDGET, help="milliseconds allowed")
+    args = parser.parse_args()
+
+    runs = [launch() for _ in range(args.runs)]
+    results = {
+        "runs": args.runs,
+        "budget_ms": args.budget,
+        "median_ms": {name: statistics.median(run[name] for run in runs) for name in runs[0]},
+        "max_ms": {name: max(run[name] for run in runs) for name in runs[0]},
+    }
+    print(json.dumps(results, indent=2))
+    if results["median_ms"]["first_frame_ms"] > args.budget:
+        print(f"first frame over budget: {results['median_ms']['first_frame_ms']:.0f} ms > {args.budget:.0f} ms",
+              file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
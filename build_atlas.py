@@ -0,0 +1,146 @@
+"""
+Texture atlas builder for Space Fighter game.
+
+Scales every sprite the game draws to the size it is drawn at and packs them
+into one image in the asset directory, with a JSON manifest of where each
+one is. At startup the game then decodes that single file instead of every
+source image, and rescales nothing. A content hash of the sources and the
+sprite list is kept in the manifest, so running it again when nothing
+changed does nothing.
+
+Example:
+    python build_atlas.py
+    python build_atlas.py --force
+"""
+import argparse
+import hashlib
+import json
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+import settings
+from src.utils.assets import ASSET_DIR
+import src.utils.upgrades as upgrades
+
+FORMAT = 1  # Bump when the manifest layout or the packing changes
+PADDING = 1  # Transparent pixels between sprites
+SHELF_WIDTH = 2048  # Width of every shelf, widened to fit a wider sprite
+
+# Menu sprites drawn with assets.pixel_art
+PIXEL_ART = (
+    "title.png", "start-btn.png", "start-btn-sel.png",
+    "diff-title.png", "diff-easy.png", "diff-easy-sel.png", "diff-medium.png", "diff-medium-sel.png",
+    "diff-hard.png", "diff-hard-sel.png",
+)
+# Sources the game rotates or scales itself, kept at their native size
+NATIVE = ("mc.png", "bul.png")
+
+
+def sprite_list():
+    """
+    Return every (file name, size) the game draws, a size of None meaning native.
+
+    Returns:
+        list: (name, size) pairs.
+    """
+    sprites = [("bg.jpg", settings.SCREEN_SIZE), ("upgrade-bg.png", settings.SCREEN_SIZE)]
+    sprites += [(name, "pixel_art") for name in PIXEL_ART]
+    sprites += [(name, upgrades.ICON_SIZE) for name in list(upgrades.ICONS.values()) + [upgrades.SELECTION_ICON]]
+    sprites += [(name, None) for name in NATIVE]
+    with open(os.path.join(ASSET_DIR, settings.ENEMY_DATA)) as file:
+        for definition in json.load(file).values():
+            if "sprite" in definition:
+                sprites.append((definition["sprite"], definition["size"]))
+    return sprites
+
+
+def content_hash(sprites):
+    """Hash the source files, the sprite list and the build settings."""
+    digest = hashlib.sha256(json.dumps([FORMAT, PADDING, SHELF_WIDTH, settings.PIXEL_ART_SCALE, sprites]).encode())
+    for name in sorted({name for name, _ in sprites}):
+        with open(os.path.join(ASSET_DIR, name), "rb") as file:
+            digest.update(name.encode())
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def pack(sizes):
+    """
+    Place rectangles on shelves, tallest first.
+
+    Args:
+        sizes (list): (width, height) of each rectangle.
+
+    Returns:
+        tuple: (x, y) of each rectangle in input order, and the atlas size.
+    """
+    width = max(SHELF_WIDTH, max(w for w, _ in sizes) + PADDING)
+    positions = [None] * len(sizes)
+    x = y = shelf_height = 0
+    for index in sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0])):
+        w, h = sizes[index]
+        if x + w > width:
+            x, y, shelf_height = 0, y + shelf_height + PADDING, 0
+        positions[index] = (x, y)
+        x += w + PADDING
+        shelf_height = max(shelf_height, h)
+    used_width = max(px + w for (px, _), (w, _) in zip(positions, sizes))
+    return positions, (used_width, y + shelf_height)
+
+
+def build(sprites, digest, image_path, manifest_path):
+    """Scale and pack the sprites and write the atlas and its manifest."""
+    sources = {name: pygame.image.load(os.path.join(ASSET_DIR, name)) for name in {name for name, _ in sprites}}
+    surfaces = []
+    sizes = []
+    for name, size in sprites:
+        source = sources[name]
+        if size == "pixel_art":
+            size = (source.get_width() * settings.PIXEL_ART_SCALE, source.get_height() * settings.PIXEL_ART_SCALE)
+        surface = source if size is None else pygame.transform.scale(source, (int(size[0]), int(size[1])))
+        surfaces.append(surface)
+        sizes.append(surface.get_size())
+
+    positions, atlas_size = pack(sizes)
+    atlas = pygame.Surface(atlas_size, pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    for surface, position in zip(surfaces, positions):
+        atlas.blit(surface, position)
+    pygame.image.save(atlas, image_path)
+
+    manifest = {
+        "hash": digest,
+        "native": {name: list(source.get_size()) for name, source in sorted(sources.items())},
+        "sprites": [[name, list(size), [x, y, size[0], size[1]]]
+                    for (name, _), size, (x, y) in zip(sprites, sizes, positions)],
+    }
+    with open(manifest_path, "w") as file:
+        json.dump(manifest, file, indent=1)
+    return atlas_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--force", action="store_true", help="rebuild even if nothing changed")
+    args = parser.parse_args()
+
+    image_path = os.path.join(ASSET_DIR, settings.ATLAS_IMAGE)
+    manifest_path = os.path.join(ASSET_DIR, settings.ATLAS_MANIFEST)
+    sprites = sprite_list()
+    digest = content_hash(sprites)
+    if not args.force and os.path.isfile(image_path) and os.path.isfile(manifest_path):
+        with open(manifest_path) as file:
+            up_to_date = json.load(file).get("hash") == digest
+        if up_to_date:
+            os.utime(manifest_path)  # Sources were only touched; mark the atlas current again
+            print("atlas up to date")
+            return
+
+    width, height = build(sprites, digest, image_path, manifest_path)
+    print(f"packed {len(sprites)} sprites into {width}x{height} {settings.ATLAS_IMAGE} "
+          f"({os.path.getsize(image_path) / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,36 @@ Main game module for Space Fighter game.
 This module contains the main Game class which controls the game loop,
 handles events, updates game state, and renders all game elements.
 """
+import time
+
+STARTED = time.perf_counter()  # Launch time, for time-to-first-frame
+
+import logging
+import os
+import random
 import pygame
 from pygame.math import Vector2
 import sys
-from src.entities.player import Player
+from src.entities.player import Player, PLAYER_SHEET
 import src.entities.bullet
 import src.entities.enemy
+from src.entities.particles import effects
+from src.entities.steering import SwarmSteering
 import settings
 import src.utils.upgrades as upgrades
+import src.utils.assets as assets
+import src.utils.fonts as fonts
+from src.entities.spawner import Spawner, default_waves
+from src.utils.spatial_hash import SpatialHash
+from src.utils.geometry import segment_hit, swept_box_hit
+from src.utils.hud import Hud
+from src.utils.renderer import FullRenderer, DirtyRectRenderer, draw_sprites
+from src.utils.clock import SimClock, FixedTimestep
+from src.utils.input import InputState, LiveInput
+from src.utils.replay import Recorder
+from src.utils.profiler import profiler
+
+log = logging.getLogger(__name__)
 
 
 class Game:
@@ -21,12 +43,32 @@ class Game:
     This class initializes the game, handles user input, updates game state,
     and renders all game elements to the screen.
     """
-    def __init__(self):
+    def __init__(self, headless=False, input_source=None):
         """
         Initialize the game with default settings.
         
         Sets up pygame, loads assets, and initializes game state variables.
+
+        Args:
+            headless (bool): Run without a window or sound under SDL's dummy
+                drivers, unthrottled and without rendering.
+            input_source: Object whose `poll(game)` returns each frame's
+                InputState. Defaults to the real keyboard and mouse.
         """
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+        self.input_source = input_source or LiveInput()
+        self.input = InputState()
+        self.sim_clock = SimClock()
+        self.timestep = FixedTimestep()
+        self.rng = random.Random()  # Every random choice in the simulation draws from this
+        self.seed = None
+        self.record_path = None  # Record each game's input to this file when set
+        self.recorder = None
+        self.trace_path = None  # Written when a profiler trace is running at exit
+
         pygame.init()
         pygame.mixer.init()
         self.screen = pygame.display.set_mode(settings.SCREEN_SIZE)
@@ -34,17 +76,27 @@ class Game:
         self.clock = pygame.time.Clock()
         self.running = True
         self.state = settings.MENU
-        self.font = pygame.font.Font(None, 36)
-        self.big_font = pygame.font.Font(None, 74)
+        self.font = fonts.get(36)
+        self.big_font = fonts.get(74)
+        self.hud = Hud(self.font)
 
         self.start_btn_rect = None
         self.diff_rects = []
-        self.last_press = 0
-        
+        self.select_held = False  # Whether "select" was held last frame, so a click fires once
+        self.load_ms = None
+        self.first_frame_ms = None
+        self.last_loading_draw = 0
+
+        self.player_sheet = PLAYER_SHEET
+        if not headless:
+            self.load_assets()
+
         # Load background
-        self.background = pygame.image.load("assets/bg.jpg").convert()
-        self.background = pygame.transform.scale(self.background, settings.SCREEN_SIZE)
-        self.player_model = pygame.image.load("assets/mc.png").convert_alpha()
+        self.background = assets.get("bg.jpg", settings.SCREEN_SIZE)
+        if settings.DIRTY_RECT_RENDERING:
+            self.renderer = DirtyRectRenderer(self.screen, self.background)
+        else:
+            self.renderer = FullRenderer(self.screen, self.background)
 
         # Set these before init_game
         self.difficulty = settings.NORMAL
@@ -53,128 +105,266 @@ class Game:
 
         self.init_game()
 
-    def init_game(self):
+    def load_assets(self):
+        """
+        Decode every image and pre-rotate the player sheet behind a loading screen.
+
+        Sprites come from the prebuilt texture atlas if there is one;
+        otherwise images are decoded on worker threads and converted here.
+        The screen shows the progress of both stages.
+        """
+        started = time.perf_counter()
+        self.draw_loading(0)
+        if not assets.load_atlas():
+            assets.preload(progress=lambda done, total: self.draw_loading(done / total / 2))
+        self.player_sheet.prebuild(progress=lambda done, total: self.draw_loading(0.5 + done / total / 2))
+        self.load_ms = (time.perf_counter() - started) * 1000
+        log.info("Loaded assets in %.0f ms", self.load_ms)
+
+    def draw_loading(self, fraction):
+        """
+        Draw the loading screen, at most once per display frame.
+
+        Args:
+            fraction (float): Share of the loading work done, 0 to 1.
+        """
+        now = time.perf_counter()
+        if fraction < 1 and now - self.last_loading_draw < 1 / settings.FPS:
+            return
+        self.last_loading_draw = now
+        pygame.event.pump()  # Keep the window responsive while loading
+
+        width, height = settings.SCREEN_SIZE
+        bar = pygame.Rect(0, 0, width // 2, 20)
+        bar.center = (width // 2, height // 2)
+        self.screen.fill(settings.BLACK)
+        text = self.font.render("Loading...", True, settings.WHITE)
+        self.screen.blit(text, text.get_rect(midbottom=(bar.centerx, bar.top - 10)))
+        pygame.draw.rect(self.screen, settings.WHITE, bar, 2)
+        pygame.draw.rect(self.screen, settings.WHITE, (bar.x, bar.y, round(bar.width * fraction), bar.height))
+        pygame.display.flip()
+
+    def init_game(self, seed=None):
         """
         Initialize or reset the game state for a new game.
         
         Creates player and enemy groups, resets timers, score, and other game variables.
+        Restarts the simulation clock and reseeds the game's random source, so
+        the same seed and input always play out the same game.
+
+        Args:
+            seed (int): Seed for the game's random source; random if None.
         """
-        self.player = Player((settings.SCREEN_SIZE[0] // 2, settings.SCREEN_SIZE[1] - 50), 0)
+        # Hand sprites from a previous game back to their pools
+        if hasattr(self, "enemies"):
+            for enemy in self.enemies:
+                enemy.kill()
+            self.player.projectiles.clear()
+        effects.clear()
+        self.seed = random.randrange(2**32) if seed is None else seed
+        self.rng.seed(self.seed)
+        self.sim_clock.reset()
+        self.timestep.reset()
+        upgrades.clear_choices()
+        self.player = Player((settings.SCREEN_SIZE[0] // 2, settings.SCREEN_SIZE[1] - 50), 0, self.sim_clock, self.rng)
         self.enemies = pygame.sprite.Group()
-        self.spawn_timer = 0
-        self.spawn_timer_2 = 0
-
-        self.spawn_delay = 1000
-        self.spawn_delay_2 = 3000
+        self.enemy_grid = SpatialHash()
+        self.steering = SwarmSteering()
+        self.bullet_rect = pygame.Rect(0, 0, 0, 0)  # Reused swept box for projectile rows
+        self.sweep_start = Vector2()
+        self.sweep_end = Vector2()
+        self.spawner = Spawner(default_waves())
+        self.spawner.start_level(self.level, 0)
 
         self.score = 0
         self.auto_shoot_timer = 0
         self.player.upgrade_points = 0
         self.has_upgrade_available = False
 
+        self.hud.set_lives(self.player.lives)
+        self.hud.set_score(self.score, self.level)
+
 
     def handle_events(self):
         """
-        Process all game events and user input.
+        Process this frame's input.
         
-        Handles mouse clicks, keyboard input, and pygame events based on current game state.
+        Handles mouse clicks, keyboard input, and quit requests based on current game state.
         """
-        event_queue = pygame.event.get()
-        for event in event_queue:
-            if event.type == pygame.QUIT:
-                self.running = False
-            
-            # Debounce
-            mouse_pos = Vector2(pygame.mouse.get_pos())
-            debounce = 0.2
-            button_pressed = False
-            if pygame.mouse.get_pressed()[0] and self.last_press + debounce < pygame.time.get_ticks():
-                button_pressed = True
-                self.last_press = pygame.time.get_ticks()
-                        
-            # Menu highlighting
-            if self.state == settings.MENU: # Because mouse button isnt a KEYDOWN event
-                if button_pressed and self.start_btn_rect.collidepoint(mouse_pos):
-                    self.state = settings.DIFF_SELECT
-            
-            if self.state == settings.DIFF_SELECT:
-                if button_pressed:
-                    mouse_rect = pygame.Rect(mouse_pos.x, mouse_pos.y, 1, 1)
-                    self.difficulty = mouse_rect.collidelist(self.diff_rects)
-                    if self.difficulty != -1:
-                        self.state = settings.PLAYING
-            
-            if event.type == pygame.KEYDOWN:
-                if self.state == settings.MENU:
-                    if event.key == pygame.K_SPACE:
-                        self.state = settings.PLAYING
-
-
-                elif self.state == settings.PLAYING:
-                    if event.key == pygame.K_u:
-                        self.upgrade_menu_active = not self.upgrade_menu_active
+        state = self.input
+        if state.quit:
+            self.running = False
+        
+        # A click is the frame "select" goes down; holding it does not repeat
+        select_held = state.held("select")
+        clicked = select_held and not self.select_held
+        self.select_held = select_held
+                    
+        # Menu highlighting
+        if self.state == settings.MENU: # Because mouse button isnt a KEYDOWN event
+            if clicked and self.start_btn_rect is not None and self.start_btn_rect.collidepoint(state.mouse_pos):
+                self.state = settings.DIFF_SELECT
+                clicked = False
+        
+        if self.state == settings.DIFF_SELECT:
+            if clicked:
+                mouse_rect = pygame.Rect(state.mouse_pos, (1, 1))
+                difficulty = mouse_rect.collidelist(self.diff_rects)
+                if difficulty != -1:
+                    log.info("Starting on difficulty %d", difficulty)
+                    self.start(difficulty)
+        
+        if self.state == settings.MENU:
+            if state.triggered("confirm"):
+                self.start(self.difficulty)
 
+        elif self.state == settings.PLAYING:
+            if state.triggered("upgrade_menu"):
+                self.upgrade_menu_active = not self.upgrade_menu_active
+                upgrades.upgrade_choices(self.rng)
 
+        elif self.state == settings.GAME_OVER:
+            if state.triggered("confirm"):
+                self.start(self.difficulty)
 
-                elif self.state == settings.GAME_OVER:
-                    if event.key == pygame.K_SPACE:
-                        self.init_game()
-                        self.state = settings.PLAYING
+        if state.triggered("profiler"):
+            profiler.toggle_overlay()
 
-    def update(self, dt):
+    def update(self, dt=settings.SIM_DT):
         """
-        Update game state for the current frame.
+        Advance the game state by one simulation tick.
         
         Args:
-            dt (float): Delta time in seconds since the last frame.
+            dt (float): Length of the tick in seconds.
         
         Updates player, enemies, bullets, checks for collisions, handles level progression,
-        and updates game state.
+        and updates game state. Reads input from `self.input` and time from the
+        simulation clock, never from the devices or the wall clock.
         """
-        if self.state != settings.PLAYING or self.upgrade_menu_active:
+        if self.state != settings.PLAYING:
+            return
+
+        if self.upgrade_menu_active:
+            if self.input.held("select") and upgrades.choose_upgrade(self.player, self.input.mouse_pos, self.hud):
+                self.upgrade_menu_active = False
             return
 
-        current_time = pygame.time.get_ticks()
+        self.sim_clock.advance(dt)
+        current_time = self.sim_clock.get_ticks()
 
         # Check for level up
         if self.score >= settings.LEVEL_UP_SCORE * self.level:
             self.level += 1
-            self.spawn_delay = max(200, self.spawn_delay - 100)
-            self.spawn_delay_2 = max(200, self.spawn_delay_2 - 100)
+            self.hud.set_score(self.score, self.level)
+            self.spawner.start_level(self.level, current_time)
             
             self.has_upgrade_available = True
             self.upgrade_menu_active = True
+            upgrades.upgrade_choices(self.rng)
 
-        if pygame.mouse.get_pressed()[0]:
-            self.player.shoot()
+        with profiler.scope("player"):
+            self.player.update(current_time)
+            self.player.handle_rotation(self.input.mouse_pos)
+            if self.input.held("fire"):
+                self.player.shoot()
 
 
         # Enemy spawning with difficulty settings
-        if current_time - self.spawn_timer >= self.spawn_delay:
-            self.enemies.add(src.entities.enemy.Enemy_1(settings.SCREEN_SIZE[0], self.player, self.difficulty, self.level/2))
-            self.spawn_timer = current_time
-        if current_time - self.spawn_timer_2 >= self.spawn_delay_2 and self.level > 3:
-            self.enemies.add(src.entities.enemy.Enemy_2(settings.SCREEN_SIZE[0], self.player, self.difficulty, self.level/2))
-            self.spawn_timer_2 = current_time
-
-        self.player.handle_movement(dt)
-        self.enemies.update(dt)
-        self.player.bullets.update(dt)
+        with profiler.scope("spawning"):
+            for name in self.spawner.due(current_time):
+                self.enemies.add(src.entities.enemy.spawn(name, settings.SCREEN_SIZE[0], self.player, self.difficulty, self.level/2, self.rng))
+
+        with profiler.scope("player"):
+            self.player.handle_movement(dt, self.input)
+        with profiler.scope("ai"):
+            self.steering.update(self.enemies, self.player, dt)
+        with profiler.scope("bullets"):
+            self.player.projectiles.update(dt, current_time)
         
-        # Update damage indicators
-        src.entities.enemy.Enemy_1.damage_indicators.update(dt)
+        # Update damage indicators and particles
+        with profiler.scope("indicators"):
+            src.entities.enemy.damage_indicators.update(dt)
+        with profiler.scope("particles"):
+            effects.update(dt)
+
+        with profiler.scope("collisions"):
+            self.check_projectile_collisions()
+            self.check_player_collision()
+
+    def check_projectile_collisions(self):
+        """
+        Damage enemies hit by the player's projectiles.
+
+        Bullets are swept along the path they covered this tick, so fast
+        bullets cannot skip over an enemy between two ticks. Bullets and
+        beams both hit the earliest enemies along their path first and use
+        up one pierce per enemy hit; a bullet hits each enemy at most once.
+        """
+        projectiles = self.player.projectiles
+
+        # Broadphase: only test enemies sharing a grid cell with each bullet
+        self.enemy_grid.rebuild(self.enemies)
 
         # Check bullet-enemy collisions with health system
-        for bullet in self.player.bullets:
-            hits = pygame.sprite.spritecollide(bullet, self.enemies, False)
-            if hits:
-                bullet.enemies_left_to_pierce -= 1
-                for enemy in hits:
-                    if enemy.take_damage(bullet.damage):
-                        self.score += enemy.score_value  # Score based on difficulty and level
-                        enemy.kill()
+        bullet_rect = self.bullet_rect
+        start = self.sweep_start
+        end = self.sweep_end
+        pierce = projectiles.pierce
+        hit_serials = projectiles.hit
+        for i in range(projectiles.count):
+            if pierce[i] <= 0:
+                continue
+            projectiles.sweep(i, start, end, bullet_rect)
+            half = float(projectiles.half_size[i])
+            already_hit = hit_serials[i] or ()
+            hits = []
+            for enemy in self.enemy_grid.query(bullet_rect):
+                # A bullet damages each enemy once, however long it takes to pass through
+                if enemy.alive() and enemy.serial not in already_hit:
+                    t = swept_box_hit(start, end, half, enemy)
+                    if t is not None:
+                        hits.append((t, enemy))
+            if not hits:
+                continue
+            hits.sort(key=lambda hit: hit[0])
+            if hit_serials[i] is None:
+                hit_serials[i] = set()
+            damage = float(projectiles.damage[i])
+            for t, enemy in hits[:pierce[i]]:
+                pierce[i] -= 1
+                hit_serials[i].add(enemy.serial)
+                self.damage_enemy(enemy, damage, start.lerp(end, t), "spark")
+
+        # Beams hit enemies along their segment, nearest first, until pierce runs out
+        for beam in projectiles.beams:
+            hits = []
+            for enemy in self.enemy_grid.query_segment(beam.start, beam.end):
+                if enemy.alive():
+                    t = segment_hit(beam.start, beam.end, enemy)
+                    if t is not None:
+                        hits.append((t, enemy))
+            hits.sort(key=lambda hit: hit[0])
+            for t, enemy in hits[:beam.enemies_left_to_pierce]:
+                beam.enemies_left_to_pierce -= 1
+                self.damage_enemy(enemy, beam.damage, beam.start.lerp(beam.end, t), "glow")
+
+    def damage_enemy(self, enemy, damage, contact=None, effect=None):
+        """
+        Apply projectile damage to an enemy and score it if it dies.
 
-        self.check_player_collision()
+        Args:
+            enemy (Enemy): The enemy that was hit.
+            damage (float): Amount of damage dealt.
+            contact (Vector2): Where the hit landed, for the hit effect.
+            effect (str): Particle effect played at `contact`, if any.
+        """
+        if effect is not None:
+            effects.emit(effect, contact, enemy.template.effect_color)
+        if enemy.take_damage(damage):
+            self.score += enemy.score_value  # Score based on difficulty and level
+            self.hud.set_score(self.score, self.level)
+            effects.emit("explosion", enemy.position, enemy.template.effect_color)
+            enemy.kill()
 
     def check_player_collision(self):
         """
@@ -182,11 +372,15 @@ class Game:
         
         Reduces player lives on collision and updates game state if player runs out of lives.
         """
-        current_time = pygame.time.get_ticks()
-        for enemy in self.enemies:
+        current_time = self.sim_clock.get_ticks()
+        hit_radius = self.player.radius + 15
+        for enemy in self.enemy_grid.query_radius(self.player.position, hit_radius):
+            if not enemy.alive():
+                continue
             distance = self.player.position.distance_to(enemy.position)
-            if distance < self.player.radius + 15:
+            if distance < hit_radius:
                 self.player.get_hit(current_time)
+                self.hud.set_lives(self.player.lives)
                 enemy.kill()
                 if self.player.lives <= 0:
                     self.state = settings.GAME_OVER
@@ -198,23 +392,21 @@ class Game:
         
         Displays title and start button with hover effects.
         """
-        title = pygame.image.load("assets/title.png").convert_alpha()
-        title = pygame.transform.scale(title, Vector2(64,12)*8)
+        title = assets.pixel_art("title.png")
         title_rect = title.get_rect(center=(settings.SCREEN_SIZE[0]//2, settings.SCREEN_SIZE[1]//3))
         
-        start_btn = pygame.image.load("assets/start-btn.png").convert_alpha()
-        start_btn = pygame.transform.scale(start_btn, Vector2(39,13)*8)
+        start_btn = assets.pixel_art("start-btn.png")
         start_btn_rect = start_btn.get_rect(center=(settings.SCREEN_SIZE[0]//2, (settings.SCREEN_SIZE[1]//3)*2))
         self.start_btn_rect = start_btn_rect
         
-        start_selected_btn = pygame.image.load("assets/start-btn-sel.png").convert_alpha()
-        start_selected_btn = pygame.transform.scale(start_selected_btn, Vector2(39,13)*8)
+        start_selected_btn = assets.pixel_art("start-btn-sel.png")
             
-        self.screen.blit(title, title_rect)
-        if start_btn_rect.collidepoint(Vector2(pygame.mouse.get_pos())):
-            self.screen.blit(start_selected_btn, start_btn_rect)
+        rects = [self.screen.blit(title, title_rect)]
+        if start_btn_rect.collidepoint(self.input.mouse_pos):
+            rects.append(self.screen.blit(start_selected_btn, start_btn_rect))
         else:
-            self.screen.blit(start_btn, start_btn_rect)
+            rects.append(self.screen.blit(start_btn, start_btn_rect))
+        return rects
     
     def draw_diff_sel(self):
         """
@@ -222,38 +414,35 @@ class Game:
         
         Displays difficulty options (Easy, Medium, Hard) with hover effects.
         """
-        title = pygame.image.load("assets/diff-title.png").convert_alpha()
-        title = pygame.transform.scale(title, Vector2(34,12)*8)
+        title = assets.pixel_art("diff-title.png")
         title_rect = title.get_rect(center=(settings.SCREEN_SIZE[0]//2, settings.SCREEN_SIZE[1]//6))
         
         difficulty_btns = [
-            [pygame.image.load("assets/diff-easy.png").convert_alpha(), Vector2(28, 10)],
-            [pygame.image.load("assets/diff-medium.png").convert_alpha(), Vector2(41, 10)],
-            [pygame.image.load("assets/diff-hard.png").convert_alpha(), Vector2(31, 10)],
+            assets.pixel_art("diff-easy.png"),
+            assets.pixel_art("diff-medium.png"),
+            assets.pixel_art("diff-hard.png"),
         ]
-        difficulty_btns = [pygame.transform.scale(x, y*8) for x, y in difficulty_btns]
         
         difficulty_selected_btns = [
-            [pygame.image.load("assets/diff-easy-sel.png").convert_alpha(), Vector2(28, 10)],
-            [pygame.image.load("assets/diff-medium-sel.png").convert_alpha(), Vector2(41, 10)],
-            [pygame.image.load("assets/diff-hard-sel.png").convert_alpha(), Vector2(31, 10)],
+            assets.pixel_art("diff-easy-sel.png"),
+            assets.pixel_art("diff-medium-sel.png"),
+            assets.pixel_art("diff-hard-sel.png"),
         ]
-        difficulty_selected_btns = [pygame.transform.scale(x, y*8) for x, y in difficulty_selected_btns]
                
-        self.diff_rects = []
-        for i, x in enumerate(difficulty_btns):
-            self.diff_rects.append(x.get_rect(center=(settings.SCREEN_SIZE[0]//2, (settings.SCREEN_SIZE[1]//3) + 50 + 120*i)))
+        if not self.diff_rects:
+            for i, x in enumerate(difficulty_btns):
+                self.diff_rects.append(x.get_rect(center=(settings.SCREEN_SIZE[0]//2, (settings.SCREEN_SIZE[1]//3) + 50 + 120*i)))
+            log.debug("Difficulty buttons at %s", self.diff_rects)
         
-        mouse_pos = Vector2(pygame.mouse.get_pos())
+        mouse_pos = self.input.mouse_pos
         
-        self.screen.blit(title, title_rect)
+        rects = [self.screen.blit(title, title_rect)]
         for i, x in enumerate(self.diff_rects):
             if x.collidepoint(mouse_pos):
-                self.screen.blit(difficulty_selected_btns[i], x)
+                rects.append(self.screen.blit(difficulty_selected_btns[i], x))
             else:
-                print(difficulty_btns)
-                print(self.diff_rects)
-                self.screen.blit(difficulty_btns[i], x)
+                rects.append(self.screen.blit(difficulty_btns[i], x))
+        return rects
 
     def draw_game_over(self):
         """
@@ -269,45 +458,11 @@ class Game:
         score_rect = score_text.get_rect(center=(settings.SCREEN_SIZE[0]//2, settings.SCREEN_SIZE[1]//2))
         restart_rect = restart_text.get_rect(center=(settings.SCREEN_SIZE[0]//2, settings.SCREEN_SIZE[1]*2//3))
 
-        self.screen.blit(game_over, game_over_rect)
-        self.screen.blit(score_text, score_rect)
-        self.screen.blit(restart_text, restart_rect)
-
-    def draw_level_progress_bar(self):
-        """
-        Draw a progress bar showing progress toward the next level.
-        
-        Visualizes current score progress as a percentage toward leveling up.
-        """
-        # Calculate progress percentage
-        next_level_threshold = self.level * settings.LEVEL_UP_SCORE
-        previous_level_threshold = (self.level - 1) * settings.LEVEL_UP_SCORE
-        progress = (self.score - previous_level_threshold) / (next_level_threshold - previous_level_threshold)
-
-        # Draw progress bar
-        bar_width = 400
-        bar_height = 20
-        border = 2
-
-        # Bar position
-        x = (settings.SCREEN_SIZE[0] - bar_width) // 2
-        y = settings.SCREEN_SIZE[1] - 30
-
-        # Draw border
-        pygame.draw.rect(self.screen, settings.WHITE,
-                         (x - border, y - border, bar_width + 2 * border, bar_height + 2 * border))
-
-        # Draw background
-        pygame.draw.rect(self.screen, settings.BLACK, (x, y, bar_width, bar_height))
-
-        # Draw progress
-        progress_width = int(bar_width * progress)
-        pygame.draw.rect(self.screen, (0, 255, 0), (x, y, progress_width, bar_height))
-
-        # Draw text
-        progress_text = self.font.render(f"Level Progress: {int(progress * 100)}%", True, settings.WHITE)
-        text_rect = progress_text.get_rect(center=(settings.SCREEN_SIZE[0] // 2, y - 15))
-        self.screen.blit(progress_text, text_rect)
+        return [
+            self.screen.blit(game_over, game_over_rect),
+            self.screen.blit(score_text, score_rect),
+            self.screen.blit(restart_text, restart_rect),
+        ]
 
     def draw(self):
         """
@@ -315,63 +470,178 @@ class Game:
         
         Handles rendering for different game states (menu, playing, game over).
         """
-        # Draw background
-        self.screen.blit(self.background, (0, 0))
+        # Restore the background (in full, or only last frame's dirty areas)
+        renderer = self.renderer
+        with profiler.scope("background"):
+            renderer.begin_frame((self.state, self.upgrade_menu_active))
 
         if self.state == settings.MENU:
-            self.draw_menu()
+            renderer.mark(self.draw_menu())
         elif self.state == settings.DIFF_SELECT:
-            self.draw_diff_sel()
+            renderer.mark(self.draw_diff_sel())
         elif self.state == settings.PLAYING:
             # Draw game elements
-            self.player.update(pygame.time.get_ticks(), self.screen, self.player_model)
-            self.player.bullets.draw(self.screen)
-            self.enemies.draw(self.screen)
+            with profiler.scope("sprites"):
+                renderer.mark(self.player.draw(self.sim_clock.get_ticks(), self.screen, self.player_sheet))
+                renderer.mark(self.player.projectiles.draw(self.screen))
+                renderer.mark(draw_sprites(self.screen, self.enemies))
             
             # Draw health bars for all enemies
-            for enemy in self.enemies:
-                enemy.draw_health_bar(self.screen)
+            with profiler.scope("health_bars"):
+                for enemy in self.enemies:
+                    renderer.mark(enemy.draw_health_bar(self.screen))
             
             # Draw damage indicators
-            src.entities.enemy.Enemy_1.damage_indicators.draw(self.screen)
+            with profiler.scope("indicator_sprites"):
+                renderer.mark(src.entities.enemy.damage_indicators.draw(self.screen))
+            with profiler.scope("particles"):
+                renderer.mark(effects.draw(self.screen))
 
-            # Draw lives, score, level
-            lives_text = self.font.render(f'Lives: {self.player.lives}', True, settings.WHITE)
-            score_text = self.font.render(f'Score: {self.score}', True, settings.WHITE)
-            level_text = self.font.render(f'Level: {self.level}', True, settings.WHITE)
-            self.screen.blit(lives_text, (10, 10))
-            self.screen.blit(score_text, (10, 50))
-            self.screen.blit(level_text, (10, 90))
-
-            # Draw level progress bar
-            self.draw_level_progress_bar()
+            # Draw lives, score, level and level progress from cached surfaces
+            with profiler.scope("hud"):
+                renderer.mark(self.hud.draw(self.screen))
 
             # Upgrade key hint
 
             # Draw upgrade menu if active
             if self.upgrade_menu_active:
-                if upgrades.draw_upgrade_menu(self.screen, self.player):
-                    self.upgrade_menu_active = False
+                with profiler.scope("upgrade_menu"):
+                    renderer.mark(self.screen.get_rect())
+                    upgrades.draw_upgrade_menu(self.screen, self.player, self.input.mouse_pos)
         elif self.state == settings.GAME_OVER:
-            self.draw_game_over()
+            renderer.mark(self.draw_game_over())
 
-        pygame.display.flip()
+        renderer.mark(profiler.draw(self.screen))
+        with profiler.scope("present"):
+            renderer.present()
+        if self.first_frame_ms is None:
+            self.first_frame_ms = (time.perf_counter() - STARTED) * 1000
+            level = logging.WARNING if self.first_frame_ms > settings.STARTUP_BUDGET else logging.INFO
+            log.log(level, "First frame %.0f ms after launch (budget %d ms)", self.first_frame_ms, settings.STARTUP_BUDGET)
+
+    def start(self, difficulty=settings.NORMAL, seed=None):
+        """
+        Start a new game directly, skipping the menus.
+
+        Args:
+            difficulty (int): Difficulty setting (EASY, NORMAL, HARD).
+            seed (int): Seed for the game's random source; random if None.
+        """
+        self.difficulty = difficulty
+        self.level = 1
+        self.upgrade_menu_active = False
+        self.init_game(seed)
+        self.state = settings.PLAYING
+        if self.record_path is not None:
+            self.recorder = Recorder(self)
+
+    def entity_counts(self):
+        """
+        Return the number of live entities of each kind, for the profiler.
+
+        Returns:
+            dict: Counts of enemies, projectiles, damage indicators and particles.
+        """
+        return {
+            "enemies": len(self.enemies),
+            "projectiles": len(self.player.projectiles),
+            "indicators": len(src.entities.enemy.damage_indicators),
+            "particles": len(effects),
+        }
+
+    def save_recording(self):
+        """Write the current game's input log to `record_path`, if recording."""
+        if self.recorder is not None:
+            self.recorder.save(self, self.record_path)
+            self.recorder = None
+
+    def step(self, dt=settings.SIM_DT, ticks=1):
+        """
+        Read one frame of input and advance the simulation without rendering.
+
+        Args:
+            dt (float): Length of each simulation tick in seconds.
+            ticks (int): Number of simulation ticks to run on this input.
+        """
+        with profiler.scope("input"):
+            self.input = self.input_source.poll(self)
+        with profiler.scope("handle_events"):
+            self.handle_events()
+        if self.recorder is not None:
+            self.input = self.recorder.record(self, self.input, ticks)
+        for _ in range(ticks):
+            with profiler.scope("update"):
+                self.update(dt)
+        if self.state == settings.GAME_OVER:
+            self.save_recording()
+
+    def simulate(self, seconds, dt=settings.SIM_DT):
+        """
+        Run the simulation as fast as possible until game over or a time limit.
+
+        Args:
+            seconds (float): Maximum simulated time in seconds.
+            dt (float): Length of each simulated frame in seconds.
+
+        Returns:
+            dict: Score, level, lives left, simulated seconds survived,
+                frames stepped and whether the game ended.
+        """
+        start_time = self.sim_clock.ticks
+        frames = 0
+        # Bounded by frames, not sim time, which stands still in the upgrade menu
+        while self.running and self.state == settings.PLAYING and frames < round(seconds / dt):
+            self.step(dt)
+            frames += 1
+        return {
+            "score": self.score,
+            "level": self.level,
+            "lives": self.player.lives,
+            "survived": (self.sim_clock.ticks - start_time) / 1000,
+            "frames": frames,
+            "game_over": self.state == settings.GAME_OVER,
+        }
 
     def run(self):
         """
         Start the main game loop.
         
         Controls the game timing, updates, rendering, and handles exit conditions.
+        Each rendered frame runs however many fixed simulation ticks its real
+        time adds up to. Headless games run one tick per loop as fast as
+        possible and never draw.
         """
         while self.running:
-            dt = self.clock.tick(settings.FPS) / 1000
-            self.handle_events()
-            self.update(dt)
-            self.draw()
-
+            if self.headless:
+                self.step()
+                continue
+            frame_time = self.clock.tick(settings.FPS) / 1000
+            profiler.begin_frame()
+            self.step(ticks=self.timestep.advance(frame_time))
+            with profiler.scope("draw"):
+                self.draw()
+            profiler.end_frame(self.entity_counts())
+
+        self.save_recording()
+        if profiler.tracing:
+            profiler.save_trace(self.trace_path)
         pygame.quit()
         sys.exit()
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Space Fighter")
+    parser.add_argument("--record", metavar="FILE", help="record each game's input to FILE for replay.py")
+    parser.add_argument("--trace", metavar="FILE", help="write a Chrome trace of every frame to FILE on exit")
+    parser.add_argument("--log-level", default=settings.LOG_LEVEL,
+                        choices=("DEBUG", "INFO", "WARNING", "ERROR"), help="lowest level of diagnostics printed")
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level, format="%(levelname)s %(name)s: %(message)s")
+
     game = Game()
+    game.record_path = args.record
+    if args.trace:
+        game.trace_path = args.trace
+        profiler.start_trace()
     game.run()
\ No newline at end of file
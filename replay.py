@@ -0,0 +1,61 @@
+"""
+Replay runner for Space Fighter game.
+
+Plays back an input log written by `main.py --record FILE`, checks that it
+ends exactly as the recorded game did, and reports how long each frame took,
+so reported frame-time spikes can be reproduced and re-measured.
+
+Example:
+    python replay.py session.sfr --render --realtime
+"""
+import argparse
+import statistics
+import time
+from main import Game
+import settings
+from src.utils.replay import Recording, ReplayInput, summarize
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", help="input log to play back")
+    parser.add_argument("--render", action="store_true", help="draw every frame in a window")
+    parser.add_argument("--realtime", action="store_true", help="throttle rendered playback to FPS")
+    parser.add_argument("--spikes", type=int, default=5, help="number of slowest frames to list")
+    args = parser.parse_args()
+
+    try:
+        recording = Recording.load(args.path)
+    except ValueError as error:
+        parser.error(str(error))
+    if recording.sim_rate != settings.SIM_RATE:
+        parser.error(f"recorded at {recording.sim_rate} ticks/s but SIM_RATE is {settings.SIM_RATE}")
+
+    game = Game(headless=not args.render, input_source=ReplayInput(recording))
+    game.start(recording.difficulty, recording.seed)
+    frame_times = []
+    for index, (ticks, _) in enumerate(recording):
+        started = time.perf_counter()
+        game.step(ticks=ticks)
+        if args.render:
+            game.draw()
+        frame_times.append(((time.perf_counter() - started) * 1000, index))
+        if args.render and args.realtime:
+            game.clock.tick(settings.FPS)
+
+    result = summarize(game)
+    expected = tuple(recording.summary)
+    print(f"replayed {len(recording)} frames: ticks={result[0]:.0f}ms score={result[1]} level={result[2]} lives={result[3]}")
+    if frame_times:
+        times = sorted(ms for ms, _ in frame_times)
+        print(f"frame ms: p50={statistics.median(times):.3f} p99={times[int(len(times) * 0.99)]:.3f} max={times[-1]:.3f}")
+        for ms, index in sorted(frame_times, reverse=True)[:args.spikes]:
+            print(f"  frame {index}: {ms:.3f} ms")
+    if result != expected:
+        print(f"DESYNC: recording ended with ticks={expected[0]:.0f}ms score={expected[1]} level={expected[2]} lives={expected[3]}")
+        raise SystemExit(1)
+    print("replay matches recording")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ including screen dimensions, colors, game states, difficulty settings, and upgra
 """
 import platform
 import ctypes
+import pygame
 
 if platform.system() == "Windows":
     ctypes.windll.user32.SetProcessDPIAware()
@@ -14,6 +15,53 @@ if platform.system() == "Windows":
 SCREEN_SIZE = (800, 600)
 FPS = 60
 
+# Simulation settings
+SIM_RATE = 60  # Fixed simulation ticks per second, independent of FPS
+SIM_DT = 1 / SIM_RATE  # Seconds per simulation tick
+MAX_FRAME_TIME = 0.25  # Longest frame the simulation catches up on, in seconds
+
+# Input settings
+# Keys bound to each action; any of them triggers it
+KEY_BINDINGS = {
+    "move_up": (pygame.K_w, pygame.K_UP),
+    "move_down": (pygame.K_s, pygame.K_DOWN),
+    "move_left": (pygame.K_a, pygame.K_LEFT),
+    "move_right": (pygame.K_d, pygame.K_RIGHT),
+    "confirm": (pygame.K_SPACE,),
+    "upgrade_menu": (pygame.K_u,),
+    "profiler": (pygame.K_F3,),
+}
+# Mouse buttons bound to each action, as indexes into the button states
+BUTTON_BINDINGS = {
+    "fire": (0,),
+    "select": (0,),
+}
+
+# Logging settings
+LOG_LEVEL = "WARNING"  # Diagnostics below this level are dropped
+
+# Profiler settings
+PROFILER_HISTORY = 60  # Frames averaged in the profiler overlay
+PROFILER_OVERLAY_REFRESH = 250  # Milliseconds between overlay text updates
+
+# Rendering settings
+DIRTY_RECT_RENDERING = False  # Only redraw and update changed areas instead of flipping
+DIRTY_RECT_THRESHOLD = 0.5  # Dirty fraction of the screen above which a full flip is used
+
+# Asset settings
+PIXEL_ART_SCALE = 8  # Menu and button sprites are drawn at 8x their native size
+ASSET_VARIANT_BUDGET = 16 * 1024 * 1024  # Bytes of derived surfaces kept cached
+ROTATION_BUCKETS = 360  # Angle steps in pre-rotated sprite atlases
+TEXT_CACHE_SIZE = 512  # Rendered strings kept by the text cache
+TEXT_FADE_STEPS = 32  # Alpha levels in a cached text fade ramp
+ENEMY_DATA = "enemies.json"  # Enemy archetype definitions in the asset directory
+FONT_FACE = None  # Font file in the asset directory for all text; None is pygame's built-in font
+DAMAGE_FONT_SIZE = 20  # Damage indicator text size
+ATLAS_IMAGE = "atlas.png"  # Texture atlas written by build_atlas.py, in the asset directory
+ATLAS_MANIFEST = "atlas.json"  # Sub-rects of every sprite in the atlas
+ASSET_LOAD_WORKERS = 4  # Threads decoding images behind the loading screen
+STARTUP_BUDGET = 1000  # Milliseconds from launch to the first menu frame before a warning
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -23,6 +71,23 @@ YELLOW = (255, 255, 0)
 HEALTH_BAR_RED = (220, 60, 60)
 HEALTH_BAR_GREEN = (60, 220, 60)
 
+# Collision settings
+SPATIAL_CELL_SIZE = 64  # Broadphase grid cell size, about two small enemies wide
+PROJECTILE_CAPACITY = 256  # Initial projectile array rows, doubled when full
+
+# Pool settings
+POOL_MAX_FREE = 1024  # Idle objects kept per pool for reuse
+
+# Steering settings
+SEPARATION_RADIUS = 40  # Enemies closer than this push each other apart
+SEPARATION_WEIGHT = 1.5  # Strength of that push relative to chasing the player
+PURSUIT_LOOKAHEAD = 0.5  # Longest time in seconds pursuers predict the player ahead
+STEERING_BATCH_MIN = 20  # Smaller swarms are steered in plain Python, which is cheaper for them
+
+# Particle settings
+PARTICLE_CAPACITY = 1024  # Most hit and death particles alive at once; the oldest are recycled
+PARTICLE_FADE_STEPS = 16  # Pre-faded sprites per particle colour and size
+
 # Game settings
 PLAYER_SPEED = 300
 BULLET_SPEED = 500
@@ -40,6 +105,17 @@ HARD = 2
 
 LEVEL_UP_SCORE = 20  # Changed from 500 to 300
 
+# Spawn pacing
+SPAWN_DELAY = 1000  # ms between chaser spawns at level 1
+SPAWN_DELAY_2 = 3000  # ms between faller spawns once they appear
+SPAWN_DELAY_STEP = 100  # Every spawn delay shrinks by this much per level up
+MIN_SPAWN_DELAY = 200  # Floor for every spawn delay
+BURST_LEVEL = 6  # First level with bursts of chasers
+BURST_DELAY = 8000  # ms between bursts at level 1 rates
+BURST_SIZE = 5  # Enemies per burst
+BURST_SPACING = 150  # ms between enemies within a burst
+SPAWN_SCHEDULE_SPAN = 30000  # ms of spawn events planned ahead at a time
+
 DIFFICULTY_SETTINGS = {
     EASY: {
         "spawn_delay": 1500,
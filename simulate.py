@@ -0,0 +1,56 @@
+"""
+Headless simulation runner for Space Fighter game.
+
+Plays games with a scripted policy under SDL's dummy drivers, as fast as the
+simulation allows, and reports how each run ended. Useful for balance and
+regression checks on machines without a display.
+
+Example:
+    python simulate.py --minutes 10 --runs 5 --difficulty hard --seed 1
+"""
+import argparse
+import random
+import time
+from main import Game
+import settings
+from src.utils.input import ScriptedInput
+from src.utils.policies import RandomPolicy, idle_policy
+
+DIFFICULTIES = {"easy": settings.EASY, "normal": settings.NORMAL, "hard": settings.HARD}
+
+
+def make_policy(name, seed):
+    if name == "idle":
+        return idle_policy
+    return RandomPolicy(random.Random(seed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    length = parser.add_mutually_exclusive_group()
+    length.add_argument("--seconds", type=float, default=60, help="simulated seconds per run")
+    length.add_argument("--minutes", type=float, help="simulated minutes per run")
+    parser.add_argument("--difficulty", choices=DIFFICULTIES, default="normal")
+    parser.add_argument("--policy", choices=("random", "idle"), default="random")
+    parser.add_argument("--seed", type=int, default=None, help="base seed for the games and the policy; random if omitted")
+    parser.add_argument("--runs", type=int, default=1)
+    args = parser.parse_args()
+    seconds = args.minutes * 60 if args.minutes is not None else args.seconds
+
+    game = Game(headless=True)
+    total_simulated = 0
+    started = time.perf_counter()
+    for run in range(args.runs):
+        seed = None if args.seed is None else random.Random(f"{args.seed}-{run}").randrange(2**32)
+        game.input_source = ScriptedInput(make_policy(args.policy, seed))
+        game.start(DIFFICULTIES[args.difficulty], seed)
+        result = game.simulate(seconds)
+        total_simulated += result["survived"]
+        print(f"run {run}: score={result['score']} level={result['level']} lives={result['lives']} "
+              f"survived={result['survived']:.1f}s game_over={result['game_over']}")
+    elapsed = time.perf_counter() - started
+    print(f"simulated {total_simulated:.1f}s in {elapsed:.2f}s ({total_simulated / max(elapsed, 1e-9):.1f}x real time)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,121 +1,163 @@
 import pygame
 from pygame.math import Vector2
+import src.utils.assets as assets
+from src.utils.rotation import RotationAtlas
+from src.utils.pool import Pool, PooledSprite
 
-class BaseBullet(pygame.sprite.Sprite):
+
+def _bullet_image():
+    return assets.image("bul.png")
+
+
+# Pre-rotated projectile sprites, shared by every bullet of a type
+SMALL_BULLET_ATLAS = RotationAtlas(_bullet_image, size=(20, 20))
+LARGE_BULLET_ATLAS = RotationAtlas(_bullet_image, size=(30, 30))
+
+
+class BallisticBullet:
     """
-    Abstract base class for all bullet types.
+    Abstract base class for bullets that fly in a straight line.
+
+    Ballistic bullets are never instantiated; each subclass only describes a
+    projectile type, and `ProjectileSystem.emit` stores the actual bullets as
+    array rows. Damage is scaled by half the damage upgrade multiplier.
     """
-    def __init__(self, position, rotation, speed, damage, offset_distance, lifetime = 1000, pierce = 0):
+    atlas = SMALL_BULLET_ATLAS
+    size = 20
+    speed = 500
+    damage = 1
+    offset_distance = 20
+    lifetime = 1000
+    pierce = 0
+
+
+class Bullet_default(BallisticBullet):
+    """
+    Default bullet class for the player's standard weapon.
+    """
+    damage = 1
+    speed = 500
+    offset_distance = 20
+
+
+class Bullet_sniper(BallisticBullet):
+    """
+    Sniper bullet class for high-damage, fast projectiles.
+    """
+    atlas = LARGE_BULLET_ATLAS
+    size = 30
+    damage = 5
+    speed = 1200
+    offset_distance = 30
+    pierce = 2
+
+
+class Bullet_shotgun(BallisticBullet):
+    """
+    Default bullet class for the player's standard weapon.
+    """
+    damage = 0.2
+    speed = 1000
+    offset_distance = 20
+    lifetime = 300
+    pierce = 1
+
+
+class BaseBullet(PooledSprite):
+    """
+    Abstract base class for sprite-based projectiles such as beams.
+
+    Subclasses are pooled: they call `reset_bullet` from their own `reset`
+    and are spawned with `<Class>.pool.acquire(...)`.
+    """
+    def __init__(self):
         super().__init__()
+        self.position = Vector2()
+        self.velocity = Vector2()
+
+    def reset_bullet(self, position, rotation, speed, damage, offset_distance, now, lifetime = 1000, pierce = 0):
+        """
+        Set the shared bullet state for a new shot fired at game time `now` (ms).
+        """
         self.rotation = float(rotation)
-        self.position = Vector2(position)
+        self.position.update(position)
         self.speed = speed
         self.damage = damage
         self.offset_distance = offset_distance
-        self.velocity = Vector2(0, -1).rotate(-self.rotation + 90) * self.speed
+        self.velocity.from_polar((self.speed, -self.rotation))
 
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = now
         self.lifetime = lifetime
         self.pierce = pierce
         self.enemies_left_to_pierce = pierce + 1
 
-
-
-    def update(self, dt):
+    def update(self, dt, now):
         """
-        Update the bullet's position and check if it's offscreen.
+        Move the projectile and kill it once its lifetime or pierce runs out.
         Override this if needed.
         """
-        direction = Vector2(-1, 0).rotate(-self.rotation)
-        offset = direction * self.offset_distance
-        shifted_position = self.position - offset
         self.position += self.velocity * dt
-        self.rect.center = shifted_position
-        screen_height = pygame.display.get_surface().get_height()
-        if self.rect.bottom < 0 or self.rect.top > screen_height or pygame.time.get_ticks() - self.start_time >= self.lifetime:
-            self.kill()
-        if self.enemies_left_to_pierce == 0:
+        if now - self.start_time >= self.lifetime or self.enemies_left_to_pierce <= 0:
             self.kill()
 
 
-class Bullet_default(BaseBullet):
-    """
-    Default bullet class for the player's standard weapon.
+class Laser(BaseBullet):
     """
-    def __init__(self, position, rotation, damage_mult):
-        image = pygame.image.load("assets/bul.png").convert_alpha()
-        image = pygame.transform.rotate(image, rotation - 90)
-        image = pygame.transform.scale(image, (20, 20))
-        damage = 1 * (damage_mult / 2)
-        speed = 500
-        offset_distance = 20
-
-        super().__init__(position, rotation, speed, damage, offset_distance)
-        self.image = image
-        self.rect = self.image.get_rect(center=position)
-
+    Laser class for a continuous beam weapon.
 
-class Bullet_sniper(BaseBullet):
-    """
-    Sniper bullet class for high-damage, fast projectiles.
+    The beam is a line segment in front of the ship. It is hit-tested
+    analytically against enemy colliders and drawn as a line, so it has
+    no image or rect.
     """
-    def __init__(self, position, rotation, damage_mult):
-        image = pygame.image.load("assets/bul.png").convert_alpha()
-        image = pygame.transform.rotate(image, rotation - 90)
-        image = pygame.transform.scale(image, (30, 30))
-        damage = 5 * (damage_mult / 2)
-        speed = 1200
-        offset_distance = 30
-        pierce = 2
-
-        super().__init__(position, rotation, speed, damage, offset_distance, pierce = pierce)
-        self.image = image
-        self.rect = self.image.get_rect(center=position)
+    color = (0, 255, 255)
+    width = 3
+    length = 1000
 
+    def __init__(self, position, rotation, damage_mult, now):
+        super().__init__()
+        self.direction = Vector2()
+        self.start = Vector2()
+        self.end = Vector2()
+        self.reset(position, rotation, damage_mult, now)
 
-class Laser(BaseBullet):
-    """
-    Laser class for a continuous beam weapon.
-    """
-    def __init__(self, position, rotation, damage_mult):
+    def reset(self, position, rotation, damage_mult, now):
+        """
+        Reinitialize a pooled beam in place for a new shot.
+        """
         damage = 0.03 * damage_mult
         speed = 5000
         offset_distance = 520
         lifetime = 100
         pierce = 1000
-        super().__init__(position, rotation, speed, damage, offset_distance, lifetime, pierce)
+        self.reset_bullet(position, rotation, speed, damage, offset_distance, now, lifetime, pierce)
 
-        self.image = pygame.Surface((3, 1000), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, (0, 255, 255), self.image.get_rect())
-        self.image = pygame.transform.rotate(self.image, self.rotation - 90)
-        self.rect = self.image.get_rect(center=position)
+        self.direction.from_polar((1, -self.rotation))
+        self.update_segment()
 
+    def update_segment(self):
+        """Recompute the beam's start and end points from its position."""
+        near = self.offset_distance - self.length / 2
+        self.start.update(self.position + self.direction * near)
+        self.end.update(self.start + self.direction * self.length)
 
-    def update(self, dt):
+    def update(self, dt, now):
         """
-        Override to exclude screen bounds check.
+        Override to keep the beam segment in step with its position.
         """
-        direction = Vector2(-1, 0).rotate(-self.rotation)
-        offset = direction * self.offset_distance
-        shifted_position = self.position - offset
-        self.position += self.velocity * dt
-        self.rect.center = shifted_position
+        super().update(dt, now)
+        self.update_segment()
 
-class Bullet_shotgun(BaseBullet):
-    """
-    Default bullet class for the player's standard weapon.
-    """
-    def __init__(self, position, rotation, damage_mult):
-        image = pygame.image.load("assets/bul.png").convert_alpha()
-        image = pygame.transform.rotate(image, rotation - 90)
-        image = pygame.transform.scale(image, (20, 20))
-        damage = 0.2 * (damage_mult / 2)
-        speed = 1000
-        offset_distance = 20
-        lifetime = 300
-        pierce = 1
-
-
-        super().__init__(position, rotation, speed, damage, offset_distance, lifetime, pierce)
-        self.image = image
-        self.rect = self.image.get_rect(center=position)
+    def draw(self, screen):
+        """
+        Draw the beam as a line.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+
+        Returns:
+            pygame.Rect: Area that was drawn.
+        """
+        return pygame.draw.line(screen, self.color, self.start, self.end, self.width)
+
+
+Laser.pool = Pool(Laser)
@@ -1,32 +1,38 @@
 """
 Enemy module for Space Fighter game.
 
-This module defines different enemy types that appear in the game with
-different behaviors, health values, and scoring characteristics.
+This module defines the enemies that appear in the game. Enemy types are
+not classes: each archetype (look, collider, AI, stat scaling) is an entry in
+assets/enemies.json, compiled once into an EnemyTemplate with a shared
+pre-rendered image and per-difficulty stats. Every enemy is an `Enemy`
+spawned from a template.
 """
+from itertools import count
+import json
 import pygame
 from pygame.math import Vector2
 import random
-import sys
 import os
-
-# Add the project root to the Python path to find the settings module
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 import settings
 from src.entities.enemy_ai import *
-
-# Initialize pygame font for damage indicators
-pygame.font.init()
-DAMAGE_FONT = pygame.font.SysFont('Arial', 14, bold=True)
+from src.utils.pool import Pool, PooledSprite
+import src.utils.assets as assets
+import src.utils.fonts as fonts
+import src.utils.text as text
 
 
-class DamageIndicator(pygame.sprite.Sprite):
+class DamageIndicator:
     """
     A floating text indicator showing damage dealt to enemies.
     
     This class creates a visual representation of damage that floats upward
-    and fades out over time.
+    and fades out over time. Indicators are not sprites: they are plain
+    slotted objects kept in a `DamageIndicators` list and drawn with one
+    `blits` call. Instances are pooled; use `DamageIndicator.pool.acquire(...)`
+    instead of the constructor.
     """
+    __slots__ = ("position", "damage", "color", "frames", "lifespan", "lifetime", "speed", "image", "rect", "_pooled")
+
     def __init__(self, position, damage, color=(255, 255, 150)):
         """
         Initialize a damage indicator.
@@ -36,25 +42,34 @@ class DamageIndicator(pygame.sprite.Sprite):
             damage (float): The amount of damage to display.
             color (tuple): RGB color for the damage text.
         """
-        super().__init__()
-        self.position = Vector2(position)
+        self.position = Vector2()
+        self.speed = Vector2(0, -50)  # Moving upward
+        self.reset(position, damage, color)
+
+    def reset(self, position, damage, color=(255, 255, 150)):
+        """
+        Reinitialize a pooled indicator in place.
+
+        Args:
+            position (Vector2): The position where the indicator should appear.
+            damage (float): The amount of damage to display.
+            color (tuple): RGB color for the damage text.
+        """
+        self.position.update(position)
         self.damage = damage
         self.color = color
-        self.alpha = 255  # Full opacity to start
         self.lifespan = 1.0  # Seconds to live
         self.lifetime = 0
-        self.speed = Vector2(0, -50)  # Moving upward
         
-        # Render the damage text
+        # Shared pre-faded renderings of the damage text, opaque first
+        self.frames = text.fade_ramp(fonts.get(settings.DAMAGE_FONT_SIZE), f"-{self.damage:.1f}", self.color)
         self.update_image()
         self.rect = self.image.get_rect(center=self.position)
         
     def update_image(self):
-        """Update the indicator's image with current alpha value."""
-        text = DAMAGE_FONT.render(f"-{self.damage:.1f}", True, self.color)
-        self.image = pygame.Surface(text.get_size(), pygame.SRCALPHA)
-        self.image.blit(text, (0, 0))
-        self.image.set_alpha(self.alpha)
+        """Pick the fade frame matching the indicator's age."""
+        step = int(len(self.frames) * self.lifetime / self.lifespan)
+        self.image = self.frames[min(step, len(self.frames) - 1)]
         
     def update(self, dt):
         """
@@ -62,159 +77,241 @@ class DamageIndicator(pygame.sprite.Sprite):
         
         Args:
             dt (float): Delta time in seconds since the last frame.
+
+        Returns:
+            bool: False once the indicator has faded out.
         """
         self.lifetime += dt
         if self.lifetime >= self.lifespan:
-            self.kill()
-            return
+            return False
             
         # Move upward
         self.position += self.speed * dt
         
         # Fade out
-        self.alpha = max(0, 255 * (1 - self.lifetime / self.lifespan))
         self.update_image()
         
         # Update rect position
         self.rect.center = self.position
+        return True
 
 
-class Enemy_1(pygame.sprite.Sprite):
+DamageIndicator.pool = Pool(DamageIndicator)
+
+
+class DamageIndicators:
     """
-    Basic enemy class with simple movement pattern.
-    
-    A small circular enemy that follows the player using basic AI.
+    The live damage indicators, in a plain list.
     """
-    # Class-level damage indicators group
-    damage_indicators = pygame.sprite.Group()
-    
-    def __init__(self, screen_width, player, difficulty=settings.NORMAL, health = 1):
+    def __init__(self):
+        """Initialize an empty collection."""
+        self.indicators = []
+
+    def __len__(self):
+        return len(self.indicators)
+
+    def __iter__(self):
+        return iter(self.indicators)
+
+    def add(self, indicator):
         """
-        Initialize a basic enemy.
-        
+        Show an indicator until it fades out.
+
         Args:
-            screen_width (int): Width of the game screen.
-            player (Player): Reference to the player object.
-            difficulty (int): Difficulty setting (EASY, NORMAL, HARD) affecting enemy stats.
-            health (float): Base health modifier for the enemy.
+            indicator (DamageIndicator): Indicator from `DamageIndicator.pool`.
         """
-        super().__init__()
-        self.image = pygame.Surface((30, 30), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, settings.RED, (15, 15), 15)
+        self.indicators.append(indicator)
 
-        # Position at top of screen at random x coordinate
-        self.position = pygame.math.Vector2(
-            random.randint(30, screen_width - 30),
-            -30
-        )
+    def update(self, dt):
+        """
+        Update every indicator and hand faded ones back to the pool.
 
-        # Set difficulty-based attributes
-        difficulty_settings = settings.DIFFICULTY_SETTINGS[difficulty]
-        self.speed = difficulty_settings["enemy_speed"]
-        self.health = difficulty_settings["enemy_health"] + health
-        self.max_health = self.health  # Store max health for health bar
-        self.score_value = difficulty_settings["score_multiplier"]
+        Args:
+            dt (float): Delta time in seconds since the last frame.
+        """
+        live = []
+        for indicator in self.indicators:
+            if indicator.update(dt):
+                live.append(indicator)
+            else:
+                DamageIndicator.pool.release(indicator)
+        self.indicators = live
 
-        self.rect = self.image.get_rect(center=self.position)
+    def draw(self, screen):
+        """
+        Draw every indicator.
 
-        self.player = player  
+        Args:
+            screen (pygame.Surface): Surface to draw on.
 
-        self.ai = BasicAI(self, player)
-    
-    def update(self, dt):
+        Returns:
+            list: Areas that were drawn.
         """
-        Update enemy position and behavior.
-        
+        return screen.blits([(indicator.image, indicator.rect) for indicator in self.indicators])
+
+    def clear(self):
+        """Remove every indicator."""
+        for indicator in self.indicators:
+            DamageIndicator.pool.release(indicator)
+        self.indicators = []
+
+
+# Damage indicators of every enemy
+damage_indicators = DamageIndicators()
+
+
+class EnemyTemplate:
+    """
+    A compiled enemy archetype shared by every enemy spawned from it.
+    """
+    def __init__(self, name, definition):
+        """
+        Compile an archetype from its data file entry.
+
         Args:
-            dt (float): Delta time in seconds since the last frame.
+            name (str): Archetype name.
+            definition (dict): The entry; see assets/enemies.json.
         """
-        if self.player:
-            self.ai.update(dt)
+        self.name = name
+        size = tuple(definition["size"])
+        if "sprite" in definition:
+            self.image = assets.get(definition["sprite"], size)
+        else:
+            self.image = pygame.Surface(size, pygame.SRCALPHA)
+            color = definition["color"]
+            if definition["shape"] == "circle":
+                pygame.draw.circle(self.image, color, (size[0] // 2, size[1] // 2), min(size) // 2)
+            else:
+                pygame.draw.rect(self.image, color, definition.get("shape_rect", (0, 0) + size))
 
-        if self.position.y > 650:
-            self.kill()
-    
-    def draw_health_bar(self, screen):
+        # Circles collide with beams as a circle, everything else as its rect
+        self.radius = min(size) // 2 if definition["collider"] == "circle" else None
+        self.ai = AI_TYPES[definition["ai"]]
+        self.health_scale = definition.get("health_scale", 1.0)
+        self.indicator_color = tuple(definition.get("indicator_color", (255, 255, 150)))
+        # Colour of hit sparks and the death explosion
+        self.effect_color = tuple(definition.get("effect_color", definition.get("color", self.indicator_color)))
+
+        bar = definition.get("health_bar", {})
+        self.bar_height = bar.get("height", 5)
+        self.bar_offset = bar.get("offset", 10)
+        self.bar_color = tuple(bar.get("color", settings.HEALTH_BAR_RED))
+        high_color = bar.get("high_color")
+        self.bar_high_color = tuple(high_color) if high_color else self.bar_color
+
+        # (speed, base health, score) per difficulty
+        speed_scale = definition.get("speed_scale", 1.0)
+        score_scale = definition.get("score_scale", 1)
+        self.stats = {
+            difficulty: (values["enemy_speed"] * speed_scale, values["enemy_health"], values["score_multiplier"] * score_scale)
+            for difficulty, values in settings.DIFFICULTY_SETTINGS.items()
+        }
+
+
+class EnemyRegistry:
+    """
+    Enemy templates compiled from the data file on first use.
+    """
+    def __init__(self, path=os.path.join(assets.ASSET_DIR, settings.ENEMY_DATA)):
         """
-        Draw a health bar above the enemy.
-        
+        Initialize an empty registry.
+
         Args:
-            screen: The pygame surface to draw on.
+            path (str): JSON file with one entry per archetype.
         """
-        # Health bar size and position
-        bar_width = self.rect.width + 10
-        bar_height = 5
-        bar_position = (self.rect.centerx - bar_width // 2, self.rect.top - 10)
-        
-        # Health percentage
-        health_ratio = max(0, self.health / self.max_health)
-        
-        # Draw actual health (only if enemy has been damaged)
-        if health_ratio < 1.0:
-            current_width = int(bar_width * health_ratio)
-            pygame.draw.rect(screen, settings.HEALTH_BAR_RED,
-                            (bar_position[0], bar_position[1], current_width, bar_height))
+        self.path = path
+        self._templates = None
 
-    def take_damage(self, damage=1):
+    def get(self, name):
         """
-        Reduce enemy health when hit by player projectiles.
-        
+        Return the template of an archetype.
+
         Args:
-            damage (float): Amount of damage to apply to the enemy.
-            
+            name (str): Archetype name from the data file.
+
         Returns:
-            bool: True if the enemy's health reaches zero or below, False otherwise.
+            EnemyTemplate: The compiled template.
         """
-        # Create damage indicator
-        indicator = DamageIndicator(self.position, damage)
-        Enemy_1.damage_indicators.add(indicator)
-        
-        self.health -= damage
-        return self.health <= 0
+        if self._templates is None:
+            with open(self.path) as file:
+                definitions = json.load(file)
+            self._templates = {name: EnemyTemplate(name, definition) for name, definition in definitions.items()}
+        return self._templates[name]
+
+    def clear(self):
+        """Drop compiled templates, e.g. after changing DIFFICULTY_SETTINGS."""
+        self._templates = None
+
+
+registry = EnemyRegistry()
+
+# Spawn serial numbers; unlike id(), never shared by two spawns of a pooled enemy
+_serials = count(1)
 
 
-class Enemy_2(pygame.sprite.Sprite):
+class Enemy(PooledSprite):
     """
-    Advanced enemy class with more health and different movement behavior.
-    
-    A larger rectangular enemy that moves straight down, has more health,
-    and provides more score points.
+    An enemy spawned from a template.
+
+    Instances are pooled; use `spawn(...)` or `Enemy.pool.acquire(...)` to create one.
     """
-    # Use the same damage indicators group as Enemy_1
-    damage_indicators = Enemy_1.damage_indicators
-    
-    def __init__(self, screen_width, player, difficulty=settings.NORMAL, health = 1):
+    damage_indicators = damage_indicators
+
+    def __init__(self, template, screen_width, player, difficulty=settings.NORMAL, health = 1, rng=random):
         """
-        Initialize an advanced enemy.
+        Initialize an enemy.
         
         Args:
+            template (EnemyTemplate): Archetype to spawn.
             screen_width (int): Width of the game screen.
             player (Player): Reference to the player object.
             difficulty (int): Difficulty setting (EASY, NORMAL, HARD) affecting enemy stats.
             health (float): Base health modifier for the enemy.
+            rng (random.Random): Random source for the spawn position.
         """
         super().__init__()
-        self.image = pygame.Surface((60, 60), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, (0, 0, 255), (30, 30, 50, 20))
+        self.template = None
+        self.position = pygame.math.Vector2()
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.ai = None
+        self.reset(template, screen_width, player, difficulty, health, rng)
+
+    def reset(self, template, screen_width, player, difficulty=settings.NORMAL, health = 1, rng=random):
+        """
+        Reinitialize a pooled enemy in place for a new spawn.
+
+        Args:
+            template (EnemyTemplate): Archetype to spawn.
+            screen_width (int): Width of the game screen.
+            player (Player): Reference to the player object.
+            difficulty (int): Difficulty setting (EASY, NORMAL, HARD) affecting enemy stats.
+            health (float): Base health modifier for the enemy.
+            rng (random.Random): Random source for the spawn position.
+        """
+        if template is not self.template:
+            self.template = template
+            self.image = template.image
+            self.rect.size = template.image.get_size()
+            self.radius = template.radius
+            if type(self.ai) is not template.ai:
+                self.ai = template.ai(self, player)
+        self.serial = next(_serials)
 
         # Position at top of screen at random x coordinate
-        self.position = pygame.math.Vector2(
-            random.randint(30, screen_width - 30),
+        self.position.update(
+            rng.randint(30, screen_width - 30),
             -30
         )
 
-        # Set difficulty-based attributes
-        difficulty_settings = settings.DIFFICULTY_SETTINGS[difficulty]
-        self.speed = difficulty_settings["enemy_speed"]
-        self.health = difficulty_settings["enemy_health"] + health*1.5
+        # Difficulty-based attributes, precomputed by the template
+        self.speed, base_health, self.score_value = template.stats[difficulty]
+        self.health = base_health + health * template.health_scale
         self.max_health = self.health  # Store max health for health bar
-        self.score_value = difficulty_settings["score_multiplier"]
 
-        self.rect = self.image.get_rect(center=self.position)
+        self.rect.center = self.position
 
         self.player = player  
-
-        self.ai = Down_AI(self, player)
+        self.ai.player = player
     
     def update(self, dt):
         """
@@ -228,31 +325,32 @@ class Enemy_2(pygame.sprite.Sprite):
 
         if self.position.y > 650:
             self.kill()
-            
+    
     def draw_health_bar(self, screen):
         """
         Draw a health bar above the enemy.
         
         Args:
             screen: The pygame surface to draw on.
+
+        Returns:
+            pygame.Rect: Area drawn, or None at full health.
         """
-        # Health bar size and position - wider for larger enemy
+        template = self.template
+
+        # Health bar size and position
         bar_width = self.rect.width + 10
-        bar_height = 6
-        bar_position = (self.rect.centerx - bar_width // 2, self.rect.top - 12)
+        bar_position = (self.rect.centerx - bar_width // 2, self.rect.top - template.bar_offset)
         
         # Health percentage
         health_ratio = max(0, self.health / self.max_health)
         
-        # Draw actual health
+        # Draw actual health (only if enemy has been damaged)
         if health_ratio < 1.0:
             current_width = int(bar_width * health_ratio)
-            color = settings.HEALTH_BAR_RED
-            # Add color gradient based on health (blue for Enemy_2)
-            if health_ratio > 0.6:
-                color = (60, 60, 220)  # Blue for high health
-            pygame.draw.rect(screen, color,
-                            (bar_position[0], bar_position[1], current_width, bar_height))
+            color = template.bar_high_color if health_ratio > 0.6 else template.bar_color
+            return pygame.draw.rect(screen, color,
+                            (bar_position[0], bar_position[1], current_width, template.bar_height))
 
     def take_damage(self, damage=1):
         """
@@ -264,9 +362,30 @@ class Enemy_2(pygame.sprite.Sprite):
         Returns:
             bool: True if the enemy's health reaches zero or below, False otherwise.
         """
-        # Create damage indicator with a different color for Enemy_2
-        indicator = DamageIndicator(self.position, damage, color=(100, 200, 255))
-        Enemy_2.damage_indicators.add(indicator)
+        # Create damage indicator
+        indicator = DamageIndicator.pool.acquire(self.position, damage, self.template.indicator_color)
+        damage_indicators.add(indicator)
         
         self.health -= damage
-        return self.health <= 0
\ No newline at end of file
+        return self.health <= 0
+
+
+Enemy.pool = Pool(Enemy)
+
+
+def spawn(name, screen_width, player, difficulty=settings.NORMAL, health = 1, rng=random):
+    """
+    Spawn an enemy of a named archetype from the pool.
+
+    Args:
+        name (str): Archetype name from the data file.
+        screen_width (int): Width of the game screen.
+        player (Player): Reference to the player object.
+        difficulty (int): Difficulty setting (EASY, NORMAL, HARD) affecting enemy stats.
+        health (float): Base health modifier for the enemy.
+        rng (random.Random): Random source for the spawn position.
+
+    Returns:
+        Enemy: The spawned enemy.
+    """
+    return Enemy.pool.acquire(registry.get(name), screen_width, player, difficulty, health, rng)
@@ -2,10 +2,13 @@
 Enemy AI module for Space Fighter game.
 
 This module defines different AI behaviors for enemy entities,
-controlling how they move and interact with the player.
+controlling how they move and interact with the player. AIs that name a
+`steering` behaviour are moved in batches by SwarmSteering (steering.py);
+their `update` is the equivalent for a single enemy, without separation.
 """
 import pygame
 from pygame.math import Vector2
+import settings
 
 class BasicAI():
     """
@@ -13,6 +16,8 @@ class BasicAI():
     
     Moves the enemy directly toward the player's current position.
     """
+    steering = "seek"
+
     def __init__(self, enemy, player):
         """
         Initialize the basic AI controller.
@@ -46,6 +51,8 @@ class Down_AI():
     
     Ignores the player's position and simply moves downward at a constant speed.
     """
+    steering = None
+
     def __init__(self, enemy, player):
         """
         Initialize the downward movement AI controller.
@@ -76,6 +83,8 @@ class PredictiveAI():
     
     Uses the player's current speed and position to predict future location.
     """
+    steering = "pursue"
+
     def __init__(self, enemy, player):
         """
         Initialize the predictive AI controller.
@@ -95,12 +104,20 @@ class PredictiveAI():
             dt (float): Delta time in seconds since the last frame.
         """
         if self.player:
-            prediction_time = 0.5
-            predicted_position = self.player.position + self.player.acceleration * prediction_time
+            distance = self.enemy.position.distance_to(self.player.position)
+            prediction_time = min(distance / max(self.enemy.speed, 1e-9), settings.PURSUIT_LOOKAHEAD)
+            predicted_position = self.player.position + self.player.speed * prediction_time
             
             direction = predicted_position - self.enemy.position
             if direction.length() > 0:
                 direction = direction.normalize()
 
             self.enemy.position += direction * self.enemy.speed * dt
-            self.enemy.rect.center = self.enemy.position
\ No newline at end of file
+            self.enemy.rect.center = self.enemy.position
+
+# AI classes by the names used in enemy definitions
+AI_TYPES = {
+    "basic": BasicAI,
+    "down": Down_AI,
+    "predictive": PredictiveAI,
+}
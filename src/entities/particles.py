@@ -0,0 +1,157 @@
+"""
+Particle module for Space Fighter game.
+
+This module contains the ParticleSystem used for hit sparks, death explosions
+and laser contact glow. Particles live in fixed-capacity NumPy arrays used as
+a ring buffer: when the budget is full the oldest particles are overwritten,
+so the cost of effects is capped no matter how much is happening. Movement
+and fading run as one vectorized pass per tick, and drawing is a single
+`blits` call from pre-faded sprites.
+
+Particles are purely visual. They draw from their own random generator, not
+the game's, so effects never change the simulation or replays.
+"""
+import numpy as np
+import pygame
+import settings
+
+# Effect presets: particles per burst, speed range (px/s), lifetime range (s),
+# sprite size (px) and drag (fraction of speed kept per second)
+EFFECTS = {
+    "spark": {"count": 4, "speed": (80, 220), "lifetime": (0.12, 0.3), "size": 4, "drag": 0.02},
+    "explosion": {"count": 24, "speed": (40, 260), "lifetime": (0.3, 0.7), "size": 6, "drag": 0.05},
+    "glow": {"count": 1, "speed": (10, 60), "lifetime": (0.08, 0.2), "size": 8, "drag": 0.1},
+}
+
+
+def _fade_ramp(color, size, steps):
+    """Return `steps` sprites of a dot shrinking to half size and fading out."""
+    frames = []
+    for step in range(steps):
+        fade = 1 - step / steps
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        radius = max(1, round(size / 2 * (0.5 + 0.5 * fade)))
+        pygame.draw.circle(surface, (*color, round(255 * fade)), (size // 2, size // 2), radius)
+        frames.append(surface)
+    return frames
+
+
+class ParticleSystem:
+    """
+    Ring buffer of short-lived particles with a hard capacity.
+    """
+    def __init__(self, capacity=settings.PARTICLE_CAPACITY, fade_steps=settings.PARTICLE_FADE_STEPS, seed=None):
+        """
+        Initialize an empty particle system.
+
+        Args:
+            capacity (int): Most particles alive at once; older ones are recycled.
+            fade_steps (int): Pre-faded sprites per particle look.
+            seed (int): Seed for the particles' own random generator.
+        """
+        self.capacity = capacity
+        self.fade_steps = fade_steps
+        self.rng = np.random.default_rng(seed)
+        self.head = 0  # Next row to write; the oldest row once the buffer has wrapped
+        self.remaining = 0.0  # Seconds until the last live particle expires
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.drag = np.ones(capacity)
+        self.age = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity)  # Zero marks a free row
+        self.half_size = np.zeros(capacity)
+        self.kind = np.zeros(capacity, dtype=np.int32)
+        self.ramps = []  # Fade ramp of each kind, indexed by the `kind` column
+        self._kind_index = {}
+
+    def __len__(self):
+        return int(np.count_nonzero(self.age < self.lifetime))
+
+    def _kind(self, color, size):
+        key = (tuple(color), size)
+        kind = self._kind_index.get(key)
+        if kind is None:
+            kind = self._kind_index[key] = len(self.ramps)
+            self.ramps.append(_fade_ramp(key[0], size, self.fade_steps))
+        return kind
+
+    def emit(self, effect, position, color, count=None):
+        """
+        Emit a burst of particles, overwriting the oldest if the budget is full.
+
+        Args:
+            effect (str): Preset name in EFFECTS.
+            position (tuple): Burst origin.
+            color (tuple): RGB particle colour.
+            count (int): Number of particles; defaults to the preset's.
+        """
+        preset = EFFECTS[effect]
+        count = min(preset["count"] if count is None else count, self.capacity)
+        rows = (self.head + np.arange(count)) % self.capacity
+        self.head = (self.head + count) % self.capacity
+
+        angle = self.rng.uniform(0, 2 * np.pi, count)
+        speed = self.rng.uniform(*preset["speed"], count)
+        self.position[rows] = position
+        self.velocity[rows, 0] = np.cos(angle) * speed
+        self.velocity[rows, 1] = np.sin(angle) * speed
+        self.drag[rows] = preset["drag"]
+        self.age[rows] = 0
+        lifetime = self.rng.uniform(*preset["lifetime"], count)
+        self.lifetime[rows] = lifetime
+        self.remaining = max(self.remaining, float(lifetime.max()))
+        self.half_size[rows] = preset["size"] / 2
+        self.kind[rows] = self._kind(color, preset["size"])
+
+    def update(self, dt):
+        """
+        Age, move and slow down every particle.
+
+        Args:
+            dt (float): Delta time in seconds since the last frame.
+        """
+        if self.remaining <= 0:
+            return  # Every particle has expired; dead rows need no ageing
+        self.remaining -= dt
+        self.age += dt
+        self.position += self.velocity * dt
+        self.velocity *= (self.drag ** dt)[:, None]
+
+    def draw(self, screen):
+        """
+        Draw every live particle.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+
+        Returns:
+            pygame.Rect: Bounding box of the particles, or None if there are none.
+        """
+        if self.remaining <= 0:
+            return None
+        rows = np.flatnonzero(self.age < self.lifetime)
+        if rows.size == 0:
+            return None
+        half = self.half_size[rows, None]
+        topleft = self.position[rows] - half
+        steps = (self.age[rows] / self.lifetime[rows] * self.fade_steps).astype(np.int32)
+        ramps = self.ramps
+        screen.blits(
+            [(ramps[kind][step], pos)
+             for kind, step, pos in zip(self.kind[rows].tolist(), steps.tolist(), topleft.tolist())],
+            doreturn=False,
+        )
+        low = topleft.min(axis=0)
+        high = (topleft + 2 * half).max(axis=0)
+        return pygame.Rect(int(low[0]), int(low[1]), int(high[0] - low[0]) + 1, int(high[1] - low[1]) + 1)
+
+    def clear(self):
+        """Remove every particle."""
+        self.lifetime[:] = 0
+        self.age[:] = 0
+        self.head = 0
+        self.remaining = 0.0
+
+
+# Hit and death effects of every enemy
+effects = ParticleSystem()
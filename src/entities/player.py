@@ -3,10 +3,16 @@ Player module for Space Fighter game.
 
 This module defines the Player class that represents the player-controlled character in the game.
 """
-import pygame
+import random
 from pygame.math import Vector2
 import settings
 import src.entities.weapons
+from src.entities.projectiles import ProjectileSystem
+import src.utils.assets as assets
+from src.utils.rotation import RotationAtlas
+
+# Ship rotations baked once and picked by angle bucket while aiming
+PLAYER_SHEET = RotationAtlas(lambda: assets.image("mc.png"))
 
 class Player:
     """
@@ -14,22 +20,26 @@ class Player:
     
     Handles player movement, shooting, health, upgrades, and collision detection.
     """
-    def __init__(self, position, rotation):
+    def __init__(self, position, rotation, clock, rng=random):
         """
         Initialize the player object.
         
         Args:
             position (tuple): Initial position (x, y) of the player.
             rotation (float): Initial rotation angle in degrees.
+            clock (SimClock): Simulation clock shared with the weapons.
+            rng (random.Random): Random source shared with the weapons.
         """
+        self.clock = clock
+        self.rng = rng
         self.position = Vector2(position)
         self.rotation = float(rotation)
         self.speed = Vector2(0, 0)
         self.base_acceleration = 60
         self.acceleration = Vector2(self.base_acceleration, self.base_acceleration)
 
-        self.bullets = pygame.sprite.Group()
-        self.weapon = src.entities.weapons.Weapon_sniper()
+        self.projectiles = ProjectileSystem()
+        self.weapon = src.entities.weapons.Weapon_sniper(clock, rng)
         self.last_shot = 0
         self.shoot_delay = 250
 
@@ -40,7 +50,9 @@ class Player:
         self.invulnerable_duration = 2000  # 2 seconds
         self.shoot_delay = 500  # Increased delay for auto-shooting
         self.score = 0  # Add score tracking
-        self.center = Vector2(0,0)
+        width, height = PLAYER_SHEET.source_size
+        self.half_size = Vector2(width // 2, height // 2)
+        self.center = self.position + self.half_size
         self.upgrades = {
             "fire_rate": 0,  # Levels of fire rate upgrade
             "damage": 0,
@@ -48,37 +60,37 @@ class Player:
             "health": 0  # Levels of health upgrade
         }
 
-    def handle_movement(self, dt):
+    def handle_movement(self, dt, input_state):
         """
         Handle player movement based on keyboard input.
         
         Args:
             dt (float): Delta time in seconds since the last frame.
+            input_state (InputState): This frame's input.
         """
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
+        if input_state.held("move_up"):
             self.speed.y -= self.acceleration.y
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
+        if input_state.held("move_down"):
             self.speed.y += self.acceleration.y
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
+        if input_state.held("move_left"):
             self.speed.x -= self.acceleration.x
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
+        if input_state.held("move_right"):
             self.speed.x += self.acceleration.x
 
         new_pos = self.position + self.speed * dt
         self.position.x = new_pos.x if self.radius <= new_pos.x <= 800 - self.radius else self.position.x
         self.position.y = new_pos.y if self.radius <= new_pos.y <= 600 - self.radius else self.position.y
         self.speed *= 0.75
+        self.center.update(self.position + self.half_size)
 
-    def handle_rotation(self, position):
+    def handle_rotation(self, mouse_pos):
         """
         Handle player rotation based on mouse position.
         
         Args:
-            position (Vector2): Current player position.
+            mouse_pos (tuple): Mouse position the ship aims at.
         """
-        mouse_pos = Vector2(pygame.mouse.get_pos())
-        direction = mouse_pos - position
+        direction = Vector2(mouse_pos) - self.center
         self.rotation = direction.angle_to(Vector2(1, 0))
 
     def shoot(self):
@@ -88,9 +100,7 @@ class Player:
         Returns:
             bool: True if a bullet was fired, False otherwise.
         """
-        bullet = self.weapon.shoot(self.center, self.rotation, self.upgrades["fire_rate"]+1, self.upgrades["damage"]+1)
-        if bullet:
-            self.bullets.add(bullet)
+        return self.weapon.shoot(self.projectiles, self.center, self.rotation, self.upgrades["fire_rate"]+1, self.upgrades["damage"]+1)
 
     def get_hit(self, current_time):
         """
@@ -104,25 +114,32 @@ class Player:
             self.invulnerable = True
             self.invulnerable_timer = current_time
 
-    def update(self, current_time, screen, player_model):
+    def update(self, current_time):
         """
-        Update player's state and render the player on the screen.
+        Update player's state.
         
         Args:
             current_time (int): Current game time in milliseconds.
-            screen (pygame.Surface): Game screen to render the player on.
-            player_model (pygame.Surface): Player sprite image.
         """
         if self.invulnerable and current_time - self.invulnerable_timer >= self.invulnerable_duration:
             self.invulnerable = False
-        if not self.invulnerable or pygame.time.get_ticks() % 200 < 100:
-            self.center = player_model.get_rect(topleft = self.position).center
-            self.handle_rotation(self.center)
-            rotated_player = pygame.transform.rotate(player_model, self.rotation - 90)
-            new_rect = rotated_player.get_rect(center = self.center)
-            screen.blit(rotated_player, new_rect)
+
+    def draw(self, current_time, screen, player_sheet):
+        """
+        Render the player on the screen, blinking while invulnerable.
         
-        self.acceleration = Vector2(self.base_acceleration, self.base_acceleration)
+        Args:
+            current_time (int): Current game time in milliseconds.
+            screen (pygame.Surface): Game screen to render the player on.
+            player_sheet (RotationAtlas): Pre-rotated player sprites.
+
+        Returns:
+            pygame.Rect: Area drawn, or None while blinking out.
+        """
+        if not self.invulnerable or current_time % 200 < 100:
+            index = player_sheet.index(self.rotation - 90)
+            offset_x, offset_y = player_sheet.offset_at(index)
+            return screen.blit(player_sheet.frame_at(index), (self.center.x + offset_x, self.center.y + offset_y))
 
 
 def apply_upgrade(self, upgrade_type):
@@ -139,13 +156,13 @@ def apply_upgrade(self, upgrade_type):
     if upgrade_type.startswith("weapon_"):
         weapon_type = upgrade_type.split("_")[1]
         if weapon_type == "default":
-            self.weapon = src.entities.weapons.Weapon_default()
+            self.weapon = src.entities.weapons.Weapon_default(self.clock, self.rng)
         elif weapon_type == "laser":
-            self.weapon = src.entities.weapons.Weapon_laser()
+            self.weapon = src.entities.weapons.Weapon_laser(self.clock, self.rng)
         elif weapon_type == "sniper":
-            self.weapon = src.entities.weapons.Weapon_sniper()
+            self.weapon = src.entities.weapons.Weapon_sniper(self.clock, self.rng)
         elif weapon_type == "shotgun":
-            self.weapon = src.entities.weapons.Weapon_shotgun()
+            self.weapon = src.entities.weapons.Weapon_shotgun(self.clock, self.rng)
         return True
     
     # Handle regular upgrades (check levels)
@@ -0,0 +1,202 @@
+"""
+Projectile module for Space Fighter game.
+
+This module contains the ProjectileSystem, which stores every ballistic bullet
+as a row in contiguous NumPy arrays. Movement, lifetime expiry and off-screen
+culling run as one vectorized pass per tick, so the per-frame cost barely
+depends on how many bullets are in flight. Each row also keeps its position
+from the previous tick, so collisions can be tested along the whole path a
+bullet covered instead of only where it ended up.
+"""
+import numpy as np
+import pygame
+import settings
+
+
+class ProjectileSystem:
+    """
+    Structure-of-arrays store for the player's projectiles.
+
+    Ballistic bullets (see `BallisticBullet` in bullet.py) are rows in the
+    arrays below. Beam weapons are segments rather than points, so they stay
+    sprites in the `beams` group.
+    """
+    def __init__(self, capacity=settings.PROJECTILE_CAPACITY):
+        """
+        Initialize an empty projectile store.
+
+        Args:
+            capacity (int): Initial number of rows; grows automatically.
+        """
+        self.count = 0
+        self.beams = pygame.sprite.Group()
+        self.kinds = []  # Bullet classes, indexed by the `kind` column
+        self._kind_index = {}
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.position = np.zeros((capacity, 2))
+        self.previous = np.zeros((capacity, 2))  # Position before the last move
+        self.velocity = np.zeros((capacity, 2))
+        self.offset = np.zeros((capacity, 2))  # Sprite centre relative to position
+        self.half_size = np.zeros(capacity)  # Half the side of the hit box
+        self.damage = np.zeros(capacity)
+        self.pierce = np.zeros(capacity, dtype=np.int32)  # Enemies left to pierce
+        self.spawn_time = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity)
+        self.kind = np.zeros(capacity, dtype=np.int32)
+        self.frame = np.zeros(capacity, dtype=np.int32)  # Rotation atlas bucket
+        self.hit = np.full(capacity, None, dtype=object)  # Serials of the enemies hit, a set once any was
+
+    def _columns(self):
+        return (self.position, self.previous, self.velocity, self.offset, self.half_size, self.damage,
+                self.pierce, self.spawn_time, self.lifetime, self.kind, self.frame, self.hit)
+
+    def _grow(self):
+        columns = self._columns()
+        self._allocate(self.capacity * 2)
+        for old, new in zip(columns, self._columns()):
+            new[:len(old)] = old
+
+    def __len__(self):
+        return self.count + len(self.beams)
+
+    def emit(self, bullet, position, rotation, damage_mult, now):
+        """
+        Add one ballistic projectile.
+
+        Args:
+            bullet (type): A `BallisticBullet` subclass describing the projectile.
+            position (Vector2): Muzzle position.
+            rotation (float): Firing angle in degrees.
+            damage_mult (float): Damage upgrade multiplier.
+            now (int): Current game time in milliseconds.
+        """
+        if self.count == self.capacity:
+            self._grow()
+        kind = self._kind_index.get(bullet)
+        if kind is None:
+            kind = self._kind_index[bullet] = len(self.kinds)
+            self.kinds.append(bullet)
+
+        direction = pygame.math.Vector2(1, 0).rotate(-rotation)
+        i = self.count
+        self.position[i] = position
+        self.previous[i] = position
+        self.velocity[i] = direction * bullet.speed
+        self.offset[i] = direction * bullet.offset_distance
+        self.half_size[i] = bullet.size / 2
+        self.damage[i] = bullet.damage * (damage_mult / 2)
+        self.pierce[i] = bullet.pierce + 1
+        self.spawn_time[i] = now
+        self.lifetime[i] = bullet.lifetime
+        self.kind[i] = kind
+        self.frame[i] = bullet.atlas.index(rotation - 90)
+        self.hit[i] = None
+        self.count += 1
+
+    def add_beam(self, beam):
+        """
+        Add a beam projectile.
+
+        Args:
+            beam (BaseBullet): Beam sprite, e.g. a Laser.
+        """
+        self.beams.add(beam)
+
+    def update(self, dt, now):
+        """
+        Move every projectile and drop the ones that expired or left the screen.
+
+        Args:
+            dt (float): Delta time in seconds since the last frame.
+            now (int): Current game time in milliseconds.
+        """
+        self.beams.update(dt, now)
+        n = self.count
+        if n == 0:
+            return
+        position = self.position[:n]
+        self.previous[:n] = position
+        position += self.velocity[:n] * dt
+
+        center = position + self.offset[:n]
+        half = self.half_size[:n]
+        width, height = settings.SCREEN_SIZE
+        alive = (
+            (center[:, 0] + half >= 0) & (center[:, 0] - half <= width)
+            & (center[:, 1] + half >= 0) & (center[:, 1] - half <= height)
+            & (now - self.spawn_time[:n] < self.lifetime[:n])
+            & (self.pierce[:n] > 0)
+        )
+        self._compact(alive)
+
+    def _compact(self, alive):
+        """
+        Swap-remove every row whose `alive` flag is False.
+
+        Holes below the new count are filled with survivors from above it,
+        so only removed rows are touched and the arrays stay contiguous.
+        """
+        n = self.count
+        new_count = int(np.count_nonzero(alive))
+        if new_count == n:
+            return
+        holes = np.flatnonzero(~alive[:new_count])
+        movers = np.flatnonzero(alive[new_count:]) + new_count
+        for column in self._columns():
+            column[holes] = column[movers]
+        self.count = new_count
+
+    def sweep(self, i, start, end, rect):
+        """
+        Write the path a projectile's hit box centre covered in the last tick.
+
+        Args:
+            i (int): Row index.
+            start (Vector2): Updated in place to the centre before the move.
+            end (Vector2): Updated in place to the centre after the move.
+            rect (pygame.Rect): Updated in place to the bounding box of the
+                hit box over the whole move, for broadphase queries.
+
+        Returns:
+            pygame.Rect: The updated rect.
+        """
+        offset_x, offset_y = self.offset[i]
+        start.update(self.previous[i, 0] + offset_x, self.previous[i, 1] + offset_y)
+        end.update(self.position[i, 0] + offset_x, self.position[i, 1] + offset_y)
+        half = self.half_size[i]
+        left = min(start.x, end.x) - half
+        top = min(start.y, end.y) - half
+        rect.update(int(left), int(top), int(max(start.x, end.x) + half - left) + 1, int(max(start.y, end.y) + half - top) + 1)
+        return rect
+
+    def draw(self, screen):
+        """
+        Draw all projectiles.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+
+        Returns:
+            list: Areas that were drawn.
+        """
+        rects = []
+        n = self.count
+        if n:
+            topleft = (self.position[:n] + self.offset[:n] - self.half_size[:n, None]).tolist()
+            kinds = self.kinds
+            rects = screen.blits(
+                [(kinds[kind].atlas.frame_at(frame), pos)
+                 for kind, frame, pos in zip(self.kind[:n].tolist(), self.frame[:n].tolist(), topleft)],
+            )
+        for beam in self.beams:
+            rects.append(beam.draw(screen))
+        return rects
+
+    def clear(self):
+        """Remove every projectile."""
+        self.count = 0
+        for beam in self.beams:
+            beam.kill()
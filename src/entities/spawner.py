@@ -2,12 +2,133 @@
 Enemy spawner module for Space Fighter game.
 
 This module is responsible for spawning enemies based on the current difficulty level.
+Spawn rules describe repeating waves; when a level starts the spawner lays out
+every spawn event of the coming stretch of time in a heap, so each frame only
+peeks at the earliest event and pops the ones that are due.
 """
+import heapq
+import settings
+
+
+class SpawnRule:
+    """
+    A repeating wave: a burst of one enemy type every interval, from a given level on.
+    """
+    def __init__(self, enemy, interval, min_level=1, burst=1, spacing=0):
+        """
+        Initialize a spawn rule.
+
+        Args:
+            enemy (str): Enemy archetype name from the enemy data file.
+            interval (float): Milliseconds between bursts at level 1.
+            min_level (int): First level the rule is active on.
+            burst (int): Enemies per burst.
+            spacing (float): Milliseconds between enemies within a burst.
+        """
+        self.enemy = enemy
+        self.interval = interval
+        self.min_level = min_level
+        self.burst = burst
+        self.spacing = spacing
+
+    def interval_at(self, level):
+        """
+        Return the interval between bursts on a level.
+
+        Every level up shortens it by SPAWN_DELAY_STEP, down to MIN_SPAWN_DELAY.
+
+        Args:
+            level (int): Current level.
+
+        Returns:
+            float: Milliseconds between bursts.
+        """
+        return max(settings.MIN_SPAWN_DELAY, self.interval - settings.SPAWN_DELAY_STEP * (level - 1))
+
+
+def default_waves():
+    """
+    Return the game's spawn rules, read from the current settings.
+
+    Returns:
+        list: SpawnRule objects.
+    """
+    return [
+        SpawnRule("chaser", settings.SPAWN_DELAY),
+        SpawnRule("faller", settings.SPAWN_DELAY_2, min_level=4),
+        SpawnRule("chaser", settings.BURST_DELAY, min_level=settings.BURST_LEVEL,
+                  burst=settings.BURST_SIZE, spacing=settings.BURST_SPACING),
+    ]
+
 
 class Spawner:
     """
     Enemy spawner class that manages enemy creation.
-    
+
     Handles the spawning of different enemy types based on game difficulty and level.
     """
-    enemies: map = {}  # Dictionary to store enemy types
+    def __init__(self, rules, span=settings.SPAWN_SCHEDULE_SPAN):
+        """
+        Initialize a spawner; call `start_level` before the first `due`.
+
+        Args:
+            rules (list): SpawnRule objects.
+            span (float): Milliseconds of spawns laid out at a time.
+        """
+        self.rules = rules
+        self.span = span
+        self.level = 1
+        self.events = []  # Heap of (time, sequence, rule index, burst start)
+        self.horizon = 0  # Events are scheduled up to here
+        # Time each rule last started a burst; game start counts as one
+        self.last_burst = [0.0] * len(rules)
+
+    def start_level(self, level, now):
+        """
+        Lay out the schedule for a level, dropping events planned for the last one.
+
+        Args:
+            level (int): The level that starts.
+            now (float): Current game time in milliseconds.
+        """
+        self.level = level
+        self._schedule(now)
+
+    def _schedule(self, now):
+        # Finish bursts that already started; everything else is re-planned
+        events = [event for event in self.events if event[3] <= self.last_burst[event[2]]]
+        horizon = now + self.span
+        sequence = max((event[1] for event in events), default=-1) + 1
+        for index, rule in enumerate(self.rules):
+            if self.level < rule.min_level:
+                continue
+            interval = rule.interval_at(self.level)
+            burst_time = max(now, self.last_burst[index] + interval)
+            while burst_time < horizon:
+                for i in range(rule.burst):
+                    events.append((burst_time + i * rule.spacing, sequence, index, burst_time))
+                    sequence += 1
+                burst_time += interval
+        heapq.heapify(events)
+        self.events = events
+        self.horizon = horizon
+
+    def due(self, now):
+        """
+        Pop every spawn event that is due.
+
+        Args:
+            now (float): Current game time in milliseconds.
+
+        Returns:
+            list: Archetype names to spawn now, in schedule order.
+        """
+        events = self.events
+        spawns = []
+        while events and events[0][0] <= now:
+            _, _, index, burst_start = heapq.heappop(events)
+            self.last_burst[index] = burst_start
+            spawns.append(self.rules[index].enemy)
+        if now >= self.horizon:
+            self._schedule(now)
+        return spawns
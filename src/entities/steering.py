@@ -0,0 +1,205 @@
+"""
+Steering module for Space Fighter game.
+
+This module moves whole swarms of enemies at once. Enemies whose AI names a
+steering behaviour ("seek" or "pursue") are gathered per archetype into NumPy
+arrays, steered toward the player while pushing away from neighbours, and
+written back, so the per-enemy Python work is one copy in and one copy out.
+Swarms too small to repay the fixed cost of the array code run the same
+steering in plain Python instead.
+Separation works on the totals of a uniform grid rather than on pairs of
+enemies, so it stays linear in the number of enemies however they crowd.
+Enemies with any other AI still update one by one.
+"""
+from itertools import chain
+import math
+from operator import attrgetter
+import numpy as np
+import settings
+
+# Flat-index steps to a cell's 3x3 neighbourhood are dx * grid height + dy
+_NEIGHBOURHOOD = np.array([(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)])
+_OWN_CELL = 4  # Position of (0, 0) in _NEIGHBOURHOOD
+
+_position = attrgetter("position")
+_speed = attrgetter("speed")
+
+
+def separation(positions, radius):
+    """
+    Return the push away from nearby crowds for every point.
+
+    Points are binned into a grid of `radius`-sized cells. Each point is
+    pushed away from the centre of mass of each cell in its 3x3
+    neighbourhood, in proportion to how many points the cell holds, fading
+    to nothing at twice `radius`. Working on cell totals instead of pairs
+    keeps the cost linear even when thousands of points pile up in one spot.
+
+    Args:
+        positions (np.ndarray): (n, 2) point positions.
+        radius (float): Grid cell size.
+
+    Returns:
+        np.ndarray: (n, 2) summed push per point.
+    """
+    cells = np.floor(positions / radius).astype(np.int64)
+    cells -= cells.min(axis=0) - 1  # Keep an empty border so every neighbour index is valid
+    width, height = cells.max(axis=0) + 2
+    flat = cells[:, 0] * height + cells[:, 1]
+    size = width * height
+    count = np.bincount(flat, minlength=size).astype(float)
+    sum_x = np.bincount(flat, positions[:, 0], size)
+    sum_y = np.bincount(flat, positions[:, 1], size)
+
+    neighbours = flat[:, None] + _NEIGHBOURHOOD @ (height, 1)
+    counts = count[neighbours]
+    sums_x = sum_x[neighbours]
+    sums_y = sum_y[neighbours]
+    # A point does not push itself: leave it out of its own cell
+    counts[:, _OWN_CELL] -= 1
+    sums_x[:, _OWN_CELL] -= positions[:, 0]
+    sums_y[:, _OWN_CELL] -= positions[:, 1]
+
+    occupied = np.maximum(counts, 1)
+    diff_x = positions[:, 0, None] - sums_x / occupied
+    diff_y = positions[:, 1, None] - sums_y / occupied
+    dist = np.hypot(diff_x, diff_y)
+    reach = 2 * radius
+    weight = np.where((counts > 0) & (dist > 0) & (dist < reach),
+                      counts * (reach - dist) / (reach * np.maximum(dist, 1e-9)), 0.0)
+    return np.column_stack(((diff_x * weight).sum(axis=1), (diff_y * weight).sum(axis=1)))
+
+
+class SwarmSteering:
+    """
+    Batched steering for every enemy whose AI supports it.
+    """
+    def __init__(self, radius=settings.SEPARATION_RADIUS, weight=settings.SEPARATION_WEIGHT,
+                 lookahead=settings.PURSUIT_LOOKAHEAD, batch_min=settings.STEERING_BATCH_MIN):
+        """
+        Initialize the steering system.
+
+        Args:
+            radius (float): Separation grid cell size; crowds push up to twice this far.
+            weight (float): Strength of separation relative to chasing the player.
+            lookahead (float): Longest time in seconds pursuers predict the player ahead.
+            batch_min (int): Smallest swarm steered with NumPy.
+        """
+        self.radius = radius
+        self.weight = weight
+        self.lookahead = lookahead
+        self.batch_min = batch_min
+
+    def update(self, enemies, player, dt):
+        """
+        Move every enemy for one tick and drop the ones that left the screen.
+
+        Args:
+            enemies (pygame.sprite.Group): Enemies to move.
+            player (Player): The player being chased.
+            dt (float): Delta time in seconds since the last frame.
+        """
+        swarms = {}
+        for enemy in enemies:
+            swarm = swarms.get(enemy.template)
+            if swarm is None:
+                swarms[enemy.template] = [enemy]
+            else:
+                swarm.append(enemy)
+        for template, swarm in swarms.items():
+            if template.ai.steering is None:
+                for enemy in swarm:
+                    enemy.update(dt)
+            elif len(swarm) < self.batch_min:
+                self._steer_each(swarm, template.ai.steering, player, dt)
+            else:
+                self._steer(swarm, template.ai.steering, player, dt)
+
+    def _steer(self, swarm, behaviour, player, dt):
+        n = len(swarm)
+        positions = np.fromiter(chain.from_iterable(map(_position, swarm)), float, 2 * n).reshape(n, 2)
+        speeds = np.fromiter(map(_speed, swarm), float, n)
+
+        target = np.array(player.position)
+        if behaviour == "pursue":
+            # Aim where the player will be when we could reach it, looking ahead at most `lookahead`
+            distance = np.hypot(*(target - positions).T)
+            ahead = np.minimum(distance / np.maximum(speeds, 1e-9), self.lookahead)
+            target = target + ahead[:, None] * np.array(player.speed)
+        seek = target - positions
+        seek /= np.maximum(np.hypot(seek[:, 0], seek[:, 1]), 1e-9)[:, None]
+
+        desired = seek
+        if n > 1:
+            desired = seek + self.weight * separation(positions, self.radius)
+        length = np.hypot(desired[:, 0], desired[:, 1])
+        step = np.where(length > 1e-9, speeds * dt / np.maximum(length, 1e-9), 0.0)
+        positions += desired * step[:, None]
+
+        for enemy, position in zip(swarm, positions.tolist()):
+            enemy.position.update(position)
+            enemy.rect.center = position
+        for index in np.flatnonzero(positions[:, 1] > 650).tolist():
+            swarm[index].kill()
+
+    def _steer_each(self, swarm, behaviour, player, dt):
+        # The same steering as _steer and separation(), one enemy at a time
+        radius = self.radius
+        reach = 2 * radius
+        cells = {}
+        keys = []
+        for enemy in swarm:
+            x, y = enemy.position
+            key = (math.floor(x / radius), math.floor(y / radius))
+            keys.append(key)
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = [1, x, y]
+            else:
+                cell[0] += 1
+                cell[1] += x
+                cell[2] += y
+
+        player_x, player_y = player.position
+        player_vx, player_vy = player.speed
+        moves = []
+        for enemy, (cell_x, cell_y) in zip(swarm, keys):
+            x, y = enemy.position
+            push_x = push_y = 0.0
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    cell = cells.get((cell_x + dx, cell_y + dy))
+                    if cell is None:
+                        continue
+                    count, sum_x, sum_y = cell
+                    if dx == 0 and dy == 0:
+                        count, sum_x, sum_y = count - 1, sum_x - x, sum_y - y
+                    if count <= 0:
+                        continue
+                    away_x = x - sum_x / count
+                    away_y = y - sum_y / count
+                    dist = math.hypot(away_x, away_y)
+                    if 0 < dist < reach:
+                        weight = count * (reach - dist) / (reach * dist)
+                        push_x += away_x * weight
+                        push_y += away_y * weight
+
+            target_x, target_y = player_x, player_y
+            if behaviour == "pursue":
+                ahead = min(math.hypot(player_x - x, player_y - y) / max(enemy.speed, 1e-9), self.lookahead)
+                target_x += player_vx * ahead
+                target_y += player_vy * ahead
+            seek_x = target_x - x
+            seek_y = target_y - y
+            length = max(math.hypot(seek_x, seek_y), 1e-9)
+            desired_x = seek_x / length + self.weight * push_x
+            desired_y = seek_y / length + self.weight * push_y
+            length = math.hypot(desired_x, desired_y)
+            step = enemy.speed * dt / length if length > 1e-9 else 0.0
+            moves.append((x + desired_x * step, y + desired_y * step))
+
+        for enemy, position in zip(swarm, moves):
+            enemy.position.update(position)
+            enemy.rect.center = position
+            if position[1] > 650:
+                enemy.kill()
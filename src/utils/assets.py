@@ -0,0 +1,263 @@
+"""
+Asset module for Space Fighter game.
+
+This module owns every image the game draws. Files are decoded and converted
+once, scaled copies are shared by (name, size), and derived variants (rotated
+or tinted copies) live in a memory-bounded LRU so nothing touches the disk or
+rescales mid-frame. `preload` decodes the whole asset directory up front on a
+thread pool (image decoding releases the GIL) and converts the results on the
+calling thread, which must own the display. When build_atlas.py has packed
+the sprites at their final sizes into one texture atlas, `load_atlas` serves
+them all as subsurfaces of a single decoded image instead.
+"""
+import json
+import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pygame
+import settings
+
+ASSET_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../assets"))
+IMAGE_EXTENSIONS = (".png", ".jpg")
+
+log = logging.getLogger(__name__)
+
+
+class AssetRegistry:
+    """
+    Cache of converted and pre-scaled surfaces.
+
+    Surfaces handed out by the registry are shared between all callers and
+    must be treated as read-only.
+    """
+    def __init__(self, asset_dir=ASSET_DIR, variant_budget=settings.ASSET_VARIANT_BUDGET):
+        """
+        Initialize an empty registry.
+
+        Args:
+            asset_dir (str): Directory the image names are resolved against.
+            variant_budget (int): Maximum number of bytes kept in the variant LRU.
+        """
+        self.asset_dir = asset_dir
+        self.variant_budget = variant_budget
+        self._images = {}  # name -> converted source surface
+        self._native_sizes = {}  # name -> source (width, height), known without decoding
+        self._scaled = {}  # (name, size) -> scaled surface
+        self._variants = OrderedDict()  # key -> derived surface, oldest first
+        self._variant_bytes = 0
+
+    def image(self, name):
+        """
+        Return the converted, unscaled surface for an asset file.
+
+        Args:
+            name (str): File name inside the asset directory, e.g. "bul.png".
+
+        Returns:
+            pygame.Surface: The shared source surface.
+        """
+        surface = self._images.get(name)
+        if surface is None:
+            surface = self._convert(name, pygame.image.load(os.path.join(self.asset_dir, name)))
+        return surface
+
+    def native_size(self, name):
+        """
+        Return the unscaled size of an asset file.
+
+        Args:
+            name (str): File name inside the asset directory.
+
+        Returns:
+            tuple: (width, height) of the source image.
+        """
+        size = self._native_sizes.get(name)
+        if size is None:
+            size = self._native_sizes[name] = self.image(name).get_size()
+        return size
+
+    def load_atlas(self, image=settings.ATLAS_IMAGE, manifest=settings.ATLAS_MANIFEST):
+        """
+        Serve every sprite packed by build_atlas.py from one decoded atlas.
+
+        The atlas is skipped if it is missing, or older than any of its
+        sources; those are then loaded one by one as usual.
+
+        Args:
+            image (str): Atlas image file inside the asset directory.
+            manifest (str): Manifest file inside the asset directory.
+
+        Returns:
+            bool: True if the atlas was loaded.
+        """
+        manifest_path = os.path.join(self.asset_dir, manifest)
+        image_path = os.path.join(self.asset_dir, image)
+        if not (os.path.isfile(manifest_path) and os.path.isfile(image_path)):
+            return False
+        with open(manifest_path) as file:
+            data = json.load(file)
+        built = os.path.getmtime(manifest_path)
+        if any(os.path.getmtime(os.path.join(self.asset_dir, name)) > built for name in data["native"]):
+            log.warning("Texture atlas is older than its sources; run build_atlas.py")
+            return False
+
+        sheet = pygame.image.load(image_path).convert_alpha()
+        for name, size in data["native"].items():
+            self._native_sizes[name] = tuple(size)
+        for name, size, rect in data["sprites"]:
+            surface = sheet.subsurface(rect)
+            if name.endswith(".jpg"):
+                surface = surface.convert()  # Opaque copy, see _convert
+            size = tuple(size)
+            if size == self._native_sizes[name]:
+                self._images[name] = surface
+            self._scaled[(name, size)] = surface
+        return True
+
+    def _convert(self, name, surface):
+        # Fully opaque formats blit fastest without a per-pixel alpha channel
+        if name.endswith(".jpg"):
+            surface = surface.convert()
+        else:
+            surface = surface.convert_alpha()
+        self._images[name] = surface
+        return surface
+
+    def preload(self, names=None, workers=settings.ASSET_LOAD_WORKERS, progress=None):
+        """
+        Decode images in parallel and convert them on the calling thread.
+
+        Args:
+            names (list): File names to load; defaults to every image in the
+                asset directory. Already loaded images are skipped.
+            workers (int): Decoder threads.
+            progress (callable): Called as progress(done, total) on the
+                calling thread after each image is converted.
+
+        Returns:
+            int: Number of images loaded.
+        """
+        if names is None:
+            names = sorted(name for name in os.listdir(self.asset_dir) if name.endswith(IMAGE_EXTENSIONS))
+        names = [name for name in names if name not in self._images]
+        if not names:
+            return 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(pygame.image.load, os.path.join(self.asset_dir, name)): name for name in names}
+            for done, future in enumerate(as_completed(futures), 1):
+                self._convert(futures[future], future.result())
+                if progress is not None:
+                    progress(done, len(names))
+        return len(names)
+
+    def get(self, name, size=None):
+        """
+        Return an asset scaled to the given size.
+
+        Args:
+            name (str): File name inside the asset directory.
+            size (tuple): Target (width, height), or None for the native size.
+
+        Returns:
+            pygame.Surface: The shared scaled surface.
+        """
+        if size is None:
+            return self.image(name)
+        key = (name, (int(size[0]), int(size[1])))
+        surface = self._scaled.get(key)
+        if surface is None:
+            surface = pygame.transform.scale(self.image(name), key[1])
+            self._scaled[key] = surface
+        return surface
+
+    def pixel_art(self, name, scale=settings.PIXEL_ART_SCALE):
+        """
+        Return a pixel-art asset enlarged by a whole-number factor.
+
+        Args:
+            name (str): File name inside the asset directory.
+            scale (int): Enlargement factor applied to the native size.
+
+        Returns:
+            pygame.Surface: The shared scaled surface.
+        """
+        width, height = self.native_size(name)
+        return self.get(name, (width * scale, height * scale))
+
+    def variant(self, key, build):
+        """
+        Return a derived surface, building and caching it on first use.
+
+        Variants are evicted least-recently-used first once their combined
+        pixel memory exceeds the registry's budget.
+
+        Args:
+            key (hashable): Unique key describing the variant.
+            build (callable): Zero-argument function creating the surface.
+
+        Returns:
+            pygame.Surface: The cached variant.
+        """
+        surface = self._variants.get(key)
+        if surface is not None:
+            self._variants.move_to_end(key)
+            return surface
+
+        surface = build()
+        self._variants[key] = surface
+        self._variant_bytes += _surface_bytes(surface)
+        while self._variant_bytes > self.variant_budget and len(self._variants) > 1:
+            _, evicted = self._variants.popitem(last=False)
+            self._variant_bytes -= _surface_bytes(evicted)
+        return surface
+
+    def clear(self):
+        """Drop every cached surface, e.g. after the display mode changes."""
+        self._images.clear()
+        self._native_sizes.clear()
+        self._scaled.clear()
+        self._variants.clear()
+        self._variant_bytes = 0
+
+
+def _surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+
+registry = AssetRegistry()
+
+
+def image(name):
+    """Return the converted, unscaled surface for an asset file."""
+    return registry.image(name)
+
+
+def native_size(name):
+    """Return the unscaled size of an asset file."""
+    return registry.native_size(name)
+
+
+def load_atlas(image=settings.ATLAS_IMAGE, manifest=settings.ATLAS_MANIFEST):
+    """Serve every sprite packed by build_atlas.py from one decoded atlas."""
+    return registry.load_atlas(image, manifest)
+
+
+def get(name, size=None):
+    """Return an asset scaled to the given size."""
+    return registry.get(name, size)
+
+
+def pixel_art(name, scale=settings.PIXEL_ART_SCALE):
+    """Return a pixel-art asset enlarged by a whole-number factor."""
+    return registry.pixel_art(name, scale)
+
+
+def preload(names=None, workers=settings.ASSET_LOAD_WORKERS, progress=None):
+    """Decode images in parallel and convert them on the calling thread."""
+    return registry.preload(names, workers, progress)
+
+
+def variant(key, build):
+    """Return a derived surface from the shared variant LRU."""
+    return registry.variant(key, build)
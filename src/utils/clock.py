@@ -0,0 +1,81 @@
+"""
+Clock module for Space Fighter game.
+
+This module provides the simulation clock. Game logic reads time from it
+instead of `pygame.time.get_ticks()`, so simulated time only advances when
+the game loop steps it and can run faster than real time, and the
+fixed-timestep accumulator that turns rendered frame times into a whole
+number of equal simulation ticks.
+"""
+import settings
+
+
+class SimClock:
+    """
+    Simulated game time in milliseconds, advanced by the game loop.
+    """
+    def __init__(self):
+        """Initialize the clock at time zero."""
+        self.ticks = 0.0
+
+    def advance(self, dt):
+        """
+        Move simulated time forward.
+
+        Args:
+            dt (float): Step length in seconds.
+        """
+        self.ticks += dt * 1000
+
+    def reset(self):
+        """Set simulated time back to zero."""
+        self.ticks = 0.0
+
+    def get_ticks(self):
+        """
+        Return the simulated time, like `pygame.time.get_ticks()`.
+
+        Returns:
+            int: Milliseconds of simulated time.
+        """
+        return int(self.ticks)
+
+
+class FixedTimestep:
+    """
+    Accumulator converting variable frame times into fixed simulation ticks.
+
+    Leftover time carries over to the next frame, so over time the simulation
+    runs at exactly `1 / dt` ticks per second whatever the render rate is.
+    """
+    def __init__(self, dt=settings.SIM_DT, max_frame_time=settings.MAX_FRAME_TIME):
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            dt (float): Length of one simulation tick in seconds.
+            max_frame_time (float): Frame times are clamped to this, so a long
+                hitch drops time instead of running a burst of catch-up ticks.
+        """
+        self.dt = dt
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+
+    def advance(self, frame_time):
+        """
+        Add a frame's real time and return how many ticks are now due.
+
+        Args:
+            frame_time (float): Seconds since the previous frame.
+
+        Returns:
+            int: Number of fixed ticks to run this frame.
+        """
+        self.accumulator += min(frame_time, self.max_frame_time)
+        ticks = int(self.accumulator / self.dt)
+        self.accumulator -= ticks * self.dt
+        return ticks
+
+    def reset(self):
+        """Drop any accumulated time."""
+        self.accumulator = 0.0
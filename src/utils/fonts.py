@@ -0,0 +1,71 @@
+"""
+Font module for Space Fighter game.
+
+This module hands out shared Font objects, one per (face, size, style),
+created the first time they are asked for. Faces are font files bundled in
+the asset directory, or pygame's built-in font for None, so no system font
+scan runs unless a face is neither; importing this module touches nothing.
+"""
+import os
+import pygame
+import settings
+from src.utils.assets import ASSET_DIR
+
+
+class FontRegistry:
+    """
+    Lazily filled cache of fonts keyed by face, size and style.
+
+    Fonts handed out by the registry are shared between all callers; do not
+    change their style flags.
+    """
+    def __init__(self, font_dir=ASSET_DIR):
+        """
+        Initialize an empty registry.
+
+        Args:
+            font_dir (str): Directory bundled font files are resolved against.
+        """
+        self.font_dir = font_dir
+        self._fonts = {}
+
+    def get(self, size, bold=False, italic=False, face=settings.FONT_FACE):
+        """
+        Return the font for a size and style, creating it on first use.
+
+        Args:
+            size (int): Font size in points.
+            bold (bool): Synthesize a bold style.
+            italic (bool): Synthesize an italic style.
+            face (str): Font file in the font directory, None for pygame's
+                built-in font, or a system font name as a last resort.
+
+        Returns:
+            pygame.font.Font: The shared font.
+        """
+        key = (face, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            path = None if face is None else os.path.join(self.font_dir, face)
+            if path is None or os.path.isfile(path):
+                font = pygame.font.Font(path, size)
+                font.set_bold(bold)
+                font.set_italic(italic)
+            else:
+                font = pygame.font.SysFont(face, size, bold, italic)
+            self._fonts[key] = font
+        return font
+
+    def clear(self):
+        """Drop every cached font, e.g. before pygame.quit()."""
+        self._fonts.clear()
+
+
+registry = FontRegistry()
+
+
+def get(size, bold=False, italic=False, face=settings.FONT_FACE):
+    """Return the shared font for a size and style."""
+    return registry.get(size, bold, italic, face)
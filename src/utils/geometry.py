@@ -0,0 +1,118 @@
+"""
+Geometry module for Space Fighter game.
+
+This module contains the analytic intersection tests used for beam weapons,
+where rect-vs-rect collision of a rotated sprite is far too coarse, and for
+sweeping fast bullets along the path they covered during a tick.
+"""
+import math
+
+
+def segment_circle(start, end, center, radius):
+    """
+    Intersect a line segment with a circle.
+
+    Args:
+        start (Vector2): Segment start point.
+        end (Vector2): Segment end point.
+        center (Vector2): Circle centre.
+        radius (float): Circle radius.
+
+    Returns:
+        float: Fraction along the segment (0..1) of the first contact, or None
+        if the segment misses. A segment starting inside the circle hits at 0.
+    """
+    dx = end.x - start.x
+    dy = end.y - start.y
+    fx = start.x - center.x
+    fy = start.y - center.y
+    a = dx * dx + dy * dy
+    c = fx * fx + fy * fy - radius * radius
+    if c <= 0:
+        return 0.0
+    if a == 0:
+        return None
+    b = 2 * (fx * dx + fy * dy)
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return None
+    t = (-b - math.sqrt(discriminant)) / (2 * a)
+    if 0 <= t <= 1:
+        return t
+    return None
+
+
+def segment_rect(start, end, rect):
+    """
+    Intersect a line segment with an axis-aligned rectangle (slab test).
+
+    Args:
+        start (Vector2): Segment start point.
+        end (Vector2): Segment end point.
+        rect (pygame.Rect): The rectangle.
+
+    Returns:
+        float: Fraction along the segment (0..1) of the first contact, or None
+        if the segment misses. A segment starting inside the rect hits at 0.
+    """
+    t_min = 0.0
+    t_max = 1.0
+    for origin, delta, low, high in (
+        (start.x, end.x - start.x, rect.left, rect.right),
+        (start.y, end.y - start.y, rect.top, rect.bottom),
+    ):
+        if delta == 0:
+            if origin < low or origin > high:
+                return None
+            continue
+        t1 = (low - origin) / delta
+        t2 = (high - origin) / delta
+        if t1 > t2:
+            t1, t2 = t2, t1
+        t_min = max(t_min, t1)
+        t_max = min(t_max, t2)
+        if t_min > t_max:
+            return None
+    return t_min
+
+
+def segment_hit(start, end, enemy):
+    """
+    Intersect a segment with an enemy's collider.
+
+    Enemies with a `radius` collide as a circle around their position,
+    all others as their rect.
+
+    Args:
+        start (Vector2): Segment start point.
+        end (Vector2): Segment end point.
+        enemy: Enemy sprite.
+
+    Returns:
+        float: Fraction along the segment of the first contact, or None.
+    """
+    if enemy.radius is not None:
+        return segment_circle(start, end, enemy.position, enemy.radius)
+    return segment_rect(start, end, enemy.rect)
+
+
+def swept_box_hit(start, end, half_size, enemy):
+    """
+    Sweep a square hit box along a segment against an enemy's collider.
+
+    The enemy's collider is grown by the box's half size, so the box's centre
+    path can be tested as a plain segment.
+
+    Args:
+        start (Vector2): Box centre at the start of the move.
+        end (Vector2): Box centre at the end of the move.
+        half_size (float): Half the side of the box.
+        enemy: Enemy sprite.
+
+    Returns:
+        float: Fraction along the move of the first contact, or None.
+    """
+    if enemy.radius is not None:
+        return segment_circle(start, end, enemy.position, enemy.radius + half_size)
+    grow = int(math.ceil(half_size)) * 2
+    return segment_rect(start, end, enemy.rect.inflate(grow, grow))
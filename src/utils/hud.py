@@ -0,0 +1,179 @@
+"""
+HUD module for Space Fighter game.
+
+This module draws the in-game heads-up display (lives, score, level and the
+level progress bar). Each element keeps a cached surface and only re-renders
+when the value bound to it changes; the game pushes new values at the points
+where they change instead of the HUD polling them every frame.
+"""
+import pygame
+import settings
+
+
+class HudText:
+    """
+    A line of text with a value that is re-rendered only when the value changes.
+    """
+    def __init__(self, font, template, position, color=settings.WHITE):
+        """
+        Initialize a text element.
+
+        Args:
+            font (pygame.font.Font): Font to render with.
+            template (str): Format string with one `{}` for the value.
+            position (tuple): Top-left corner on screen.
+            color (tuple): RGB text colour.
+        """
+        self.font = font
+        self.template = template
+        self.position = position
+        self.color = color
+        self.value = None
+        self.surface = None
+
+    def set(self, value):
+        """
+        Bind a new value, invalidating the cached surface if it changed.
+
+        Args:
+            value: The value shown in the template.
+        """
+        if value != self.value:
+            self.value = value
+            self.surface = None
+
+    def draw(self, screen):
+        """
+        Blit the cached text, re-rendering it first if it is stale.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+
+        Returns:
+            pygame.Rect: Area that was drawn.
+        """
+        if self.surface is None:
+            self.surface = self.font.render(self.template.format(self.value), True, self.color)
+        return screen.blit(self.surface, self.position)
+
+
+class HudProgressBar:
+    """
+    Level progress bar with a percentage label, cached until the shown progress changes.
+    """
+    def __init__(self, font, width=400, height=20, border=2):
+        """
+        Initialize the progress bar.
+
+        Args:
+            font (pygame.font.Font): Font for the percentage label.
+            width (int): Width of the bar interior in pixels.
+            height (int): Height of the bar interior in pixels.
+            border (int): Border thickness in pixels.
+        """
+        self.font = font
+        self.width = width
+        self.height = height
+        self.border = border
+
+        # Bar position
+        self.x = (settings.SCREEN_SIZE[0] - width) // 2
+        self.y = settings.SCREEN_SIZE[1] - 30
+
+        self.shown = None  # (fill width, percent) currently rendered
+        self.bar = None
+        self.label = None
+        self.label_rect = None
+
+    def set(self, progress):
+        """
+        Bind a new progress value, invalidating the cache if the visible bar or label changes.
+
+        Args:
+            progress (float): Progress toward the next level, 0..1.
+        """
+        shown = (int(self.width * progress), int(progress * 100))
+        if shown != self.shown:
+            self.shown = shown
+            self.bar = None
+
+    def _render(self):
+        fill_width, percent = self.shown
+        border = self.border
+        self.bar = pygame.Surface((self.width + 2 * border, self.height + 2 * border))
+
+        # Draw border, background and progress
+        self.bar.fill(settings.WHITE)
+        self.bar.fill(settings.BLACK, (border, border, self.width, self.height))
+        self.bar.fill((0, 255, 0), (border, border, max(0, fill_width), self.height))
+
+        self.label = self.font.render(f"Level Progress: {percent}%", True, settings.WHITE)
+        self.label_rect = self.label.get_rect(center=(settings.SCREEN_SIZE[0] // 2, self.y - 15))
+
+    def draw(self, screen):
+        """
+        Blit the cached bar and label, re-rendering them first if stale.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+
+        Returns:
+            list: Areas that were drawn.
+        """
+        if self.bar is None:
+            self._render()
+        return [
+            screen.blit(self.bar, (self.x - self.border, self.y - self.border)),
+            screen.blit(self.label, self.label_rect),
+        ]
+
+
+class Hud:
+    """
+    The in-game HUD: lives, score, level and level progress.
+    """
+    def __init__(self, font):
+        """
+        Initialize the HUD elements.
+
+        Args:
+            font (pygame.font.Font): Font used for all HUD text.
+        """
+        self.lives = HudText(font, "Lives: {}", (10, 10))
+        self.score = HudText(font, "Score: {}", (10, 50))
+        self.level = HudText(font, "Level: {}", (10, 90))
+        self.progress = HudProgressBar(font)
+
+    def set_lives(self, lives):
+        """Update the displayed number of lives."""
+        self.lives.set(lives)
+
+    def set_score(self, score, level):
+        """
+        Update the displayed score, level and level progress.
+
+        Args:
+            score (int): Current score.
+            level (int): Current level.
+        """
+        self.score.set(score)
+        self.level.set(level)
+
+        # Calculate progress percentage
+        next_level_threshold = level * settings.LEVEL_UP_SCORE
+        previous_level_threshold = (level - 1) * settings.LEVEL_UP_SCORE
+        self.progress.set((score - previous_level_threshold) / (next_level_threshold - previous_level_threshold))
+
+    def draw(self, screen):
+        """
+        Draw every HUD element from its cached surface.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+
+        Returns:
+            list: Areas that were drawn.
+        """
+        rects = [self.lives.draw(screen), self.score.draw(screen), self.level.draw(screen)]
+        rects.extend(self.progress.draw(screen))
+        return rects
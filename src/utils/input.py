@@ -0,0 +1,135 @@
+"""
+Input module for Space Fighter game.
+
+This module decouples game logic from the physical devices. Each frame the
+game asks its input source for an InputState; live play samples the mouse
+and keyboard, while headless runs use a scripted source driven by a policy.
+The devices are sampled once per frame and every consumer reads the same
+immutable snapshot, by action name through the bindings in settings.
+"""
+import pygame
+import settings
+
+
+class PressedKeys(frozenset):
+    """
+    Set of held key codes, indexable like `pygame.key.get_pressed()`.
+    """
+    def __getitem__(self, key):
+        return key in self
+
+
+NO_KEYS = PressedKeys()
+
+
+class InputState:
+    """
+    Immutable device state for one frame.
+    """
+    __slots__ = ("keys", "mouse_pos", "mouse_buttons", "pressed", "quit")
+
+    def __init__(self, keys=NO_KEYS, mouse_pos=(0, 0), mouse_buttons=(False, False, False), pressed=NO_KEYS, quit=False):
+        """
+        Initialize an input state.
+
+        Args:
+            keys: Held keys, indexable by key code (bool).
+            mouse_pos (tuple): Mouse position in screen coordinates.
+            mouse_buttons (tuple): Left, middle and right button states.
+            pressed (PressedKeys): Keys that went down during this frame.
+            quit (bool): Whether the window was asked to close.
+        """
+        set_field = object.__setattr__
+        set_field(self, "keys", keys)
+        set_field(self, "mouse_pos", tuple(mouse_pos))
+        set_field(self, "mouse_buttons", tuple(mouse_buttons))
+        set_field(self, "pressed", pressed)
+        set_field(self, "quit", quit)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("InputState is immutable")
+
+    def held(self, action):
+        """
+        Return whether any key or mouse button bound to an action is down.
+
+        Args:
+            action (str): Action name from KEY_BINDINGS or BUTTON_BINDINGS.
+
+        Returns:
+            bool: True if the action is held this frame.
+        """
+        keys = self.keys
+        for key in settings.KEY_BINDINGS.get(action, ()):
+            if keys[key]:
+                return True
+        buttons = self.mouse_buttons
+        for button in settings.BUTTON_BINDINGS.get(action, ()):
+            if buttons[button]:
+                return True
+        return False
+
+    def triggered(self, action):
+        """
+        Return whether a key bound to an action went down during this frame.
+
+        Args:
+            action (str): Action name from KEY_BINDINGS.
+
+        Returns:
+            bool: True if the action was triggered this frame.
+        """
+        pressed = self.pressed
+        return any(key in pressed for key in settings.KEY_BINDINGS.get(action, ()))
+
+
+class LiveInput:
+    """
+    Input source reading the real keyboard and mouse.
+    """
+    def poll(self, game):
+        """
+        Sample the devices and drain the event queue.
+
+        Args:
+            game (Game): The game being driven (unused).
+
+        Returns:
+            InputState: Current device state.
+        """
+        pressed = []
+        quit = False
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                quit = True
+            elif event.type == pygame.KEYDOWN:
+                pressed.append(event.key)
+        return InputState(
+            pygame.key.get_pressed(), pygame.mouse.get_pos(), pygame.mouse.get_pressed(), PressedKeys(pressed), quit
+        )
+
+
+class ScriptedInput:
+    """
+    Input source driven by a policy function instead of devices.
+    """
+    def __init__(self, policy):
+        """
+        Initialize a scripted source.
+
+        Args:
+            policy (callable): Function taking the Game and returning an InputState.
+        """
+        self.policy = policy
+
+    def poll(self, game):
+        """
+        Ask the policy for this frame's input.
+
+        Args:
+            game (Game): The game being driven.
+
+        Returns:
+            InputState: The scripted input.
+        """
+        return self.policy(game)
@@ -0,0 +1,69 @@
+"""
+Policies module for Space Fighter game.
+
+This module contains scripted players for headless simulation. A policy is a
+function (or callable object) that takes the Game and returns the
+InputState for the next frame; wrap it in `ScriptedInput` to drive a game.
+"""
+import random
+import pygame
+from src.utils.input import InputState, PressedKeys
+import src.utils.upgrades as upgrades
+
+MOVE_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d)
+
+
+def idle_policy(game):
+    """
+    Policy that never moves, aims or shoots.
+
+    Args:
+        game (Game): The game being driven.
+
+    Returns:
+        InputState: Empty input.
+    """
+    return InputState()
+
+
+class RandomPolicy:
+    """
+    Policy that aims at the nearest enemy, always shoots, drifts randomly
+    and picks a random upgrade whenever the upgrade menu opens.
+    """
+    def __init__(self, rng=None, turn_chance=0.05):
+        """
+        Initialize the policy.
+
+        Args:
+            rng (random.Random): Random source; seed it for repeatable runs.
+            turn_chance (float): Chance per frame of picking a new move direction.
+        """
+        self.rng = rng or random.Random()
+        self.turn_chance = turn_chance
+        self.keys = PressedKeys()
+
+    def __call__(self, game):
+        """
+        Choose this frame's input.
+
+        Args:
+            game (Game): The game being driven.
+
+        Returns:
+            InputState: The chosen input.
+        """
+        if game.upgrade_menu_active:
+            rect = self.rng.choice(upgrades.choice_rects(upgrades.upgrade_choices()))
+            return InputState(mouse_pos=rect.center, mouse_buttons=(True, False, False))
+
+        if self.rng.random() < self.turn_chance:
+            self.keys = PressedKeys(self.rng.sample(MOVE_KEYS, self.rng.randint(0, 2)))
+
+        player_center = game.player.center
+        target = min(
+            (enemy.rect.center for enemy in game.enemies),
+            key=player_center.distance_squared_to,
+            default=(player_center.x, 0),
+        )
+        return InputState(self.keys, target, (True, False, False))
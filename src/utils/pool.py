@@ -0,0 +1,119 @@
+"""
+Object pool module for Space Fighter game.
+
+This module provides free-list pools for short-lived objects (enemies, beams,
+damage indicators) so they are reset in place instead of being allocated and
+garbage collected at high rates.
+"""
+import pygame
+import settings
+
+POOLS = []  # Every pool created, for stats reporting
+
+
+class Pool:
+    """
+    Free list of reusable objects of one class.
+
+    Pooled classes build their long-lived parts (surfaces, AI objects) in
+    `__init__` and put everything that varies per use in `reset`, which
+    `__init__` calls with the same arguments.
+    """
+    def __init__(self, cls, max_free=settings.POOL_MAX_FREE):
+        """
+        Initialize an empty pool.
+
+        Args:
+            cls (type): Class of the pooled objects.
+            max_free (int): Maximum number of idle objects kept for reuse.
+        """
+        self.cls = cls
+        self.max_free = max_free
+        self.free = []
+        self.live = 0
+        self.hits = 0
+        self.misses = 0
+        POOLS.append(self)
+
+    def acquire(self, *args, **kwargs):
+        """
+        Return a ready-to-use object, reusing an idle one when possible.
+
+        Args:
+            *args: Arguments for the class constructor / `reset`.
+            **kwargs: Keyword arguments for the class constructor / `reset`.
+
+        Returns:
+            object: The initialized object.
+        """
+        if self.free:
+            obj = self.free.pop()
+            obj._pooled = False
+            obj.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            obj._pooled = False
+            self.misses += 1
+        self.live += 1
+        return obj
+
+    def release(self, obj):
+        """
+        Return an object to the pool. Releasing twice is a no-op.
+
+        Args:
+            obj (object): Object previously returned by `acquire`.
+        """
+        if getattr(obj, "_pooled", True):
+            return
+        obj._pooled = True
+        self.live -= 1
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+
+    @property
+    def hit_rate(self):
+        """Fraction of acquisitions served from the free list."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """
+        Return the pool counters.
+
+        Returns:
+            dict: Hits, misses, hit rate, and live/free sizes.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "live": self.live,
+            "free": len(self.free),
+        }
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """
+    Sprite that returns itself to its class's pool when killed.
+
+    Subclasses set a `pool` class attribute after the class is defined.
+    """
+    pool = None
+
+    def kill(self):
+        """Remove the sprite from all groups and release it to its pool."""
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+
+def pool_stats():
+    """
+    Return the counters of every pool, keyed by class name.
+
+    Returns:
+        dict: Class name -> `Pool.stats()`.
+    """
+    return {pool.cls.__name__: pool.stats() for pool in POOLS}
@@ -0,0 +1,230 @@
+"""
+Profiler module for Space Fighter game.
+
+This module times named scopes of each frame. While enabled it keeps rolling
+per-scope timings, entity counts and object pool counters for an on-screen overlay, and can record
+every span for export as Chrome trace-event JSON (open it in chrome://tracing
+or Perfetto). While disabled, `scope` hands back one shared no-op context
+manager, so instrumented code costs a method call and two empty calls.
+"""
+from collections import deque
+import json
+import time
+import pygame
+import settings
+import src.utils.fonts as fonts
+from src.utils.pool import pool_stats
+
+
+class _NullScope:
+    """Context manager that does nothing; shared by every disabled scope."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    """Context manager timing one span of a frame."""
+    __slots__ = ("profiler", "name", "span")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        profiler = self.profiler
+        # Spans are listed in start order, so parents precede their children
+        self.span = [self.name, time.perf_counter_ns(), 0, profiler.depth]
+        profiler.spans.append(self.span)
+        profiler.depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self.span[2] = time.perf_counter_ns()
+        self.profiler.depth -= 1
+        return False
+
+
+class Profiler:
+    """
+    Frame profiler with rolling timings, an overlay and trace capture.
+    """
+    def __init__(self, history=settings.PROFILER_HISTORY, refresh=settings.PROFILER_OVERLAY_REFRESH):
+        """
+        Initialize a disabled profiler.
+
+        Args:
+            history (int): Number of frames averaged in the overlay.
+            refresh (int): Milliseconds between overlay re-renders.
+        """
+        self.enabled = False
+        self.overlay = False
+        self.tracing = False
+        self.depth = 0
+        self.spans = []  # [name, start ns, end ns, depth] of the current frame
+        self.frame_start = 0
+        self.frame_open = False  # Whether begin_frame ran while enabled for the current frame
+        self.history = deque(maxlen=history)  # Per-frame {name: ms} totals
+        self.counts = {}
+        self.trace_events = []
+        self.trace_origin = 0
+        self.refresh = refresh
+        self.overlay_surface = None
+        self.overlay_time = 0
+        self.font = None
+
+    def scope(self, name):
+        """
+        Return a context manager timing the enclosed code as `name`.
+
+        Args:
+            name (str): Scope name; nested scopes show indented in the overlay.
+
+        Returns:
+            Context manager, the shared no-op one while disabled.
+        """
+        if not self.enabled:
+            return NULL_SCOPE
+        return _Scope(self, name)
+
+    def _update_enabled(self):
+        was_enabled = self.enabled
+        self.enabled = self.overlay or self.tracing
+        if self.enabled and not was_enabled:
+            # Enabled mid-frame: nothing timed so far belongs to a whole frame
+            self.spans = []
+            self.depth = 0
+            self.frame_open = False
+
+    def toggle_overlay(self):
+        """Show or hide the overlay, profiling only while something needs it."""
+        self.overlay = not self.overlay
+        self.history.clear()
+        self.overlay_surface = None
+        self._update_enabled()
+
+    def start_trace(self):
+        """Begin recording every span for `save_trace`."""
+        self.tracing = True
+        self.trace_events = []
+        self.trace_origin = time.perf_counter_ns()
+        self._update_enabled()
+
+    def save_trace(self, path):
+        """
+        Stop recording and write the spans as Chrome trace-event JSON.
+
+        Args:
+            path (str): Destination path.
+        """
+        self.tracing = False
+        self._update_enabled()
+        with open(path, "w") as file:
+            json.dump({"traceEvents": self.trace_events, "displayTimeUnit": "ms"}, file)
+        self.trace_events = []
+
+    def begin_frame(self):
+        """Start timing a new frame."""
+        if self.enabled:
+            self.spans = []
+            self.frame_start = time.perf_counter_ns()
+            self.frame_open = True
+
+    def end_frame(self, counts=None):
+        """
+        Finish the frame: fold its spans into the history and the trace.
+
+        A frame that began before profiling was enabled is discarded.
+
+        Args:
+            counts (dict): Entity counts to show and trace, by name.
+        """
+        if not self.enabled or not self.frame_open:
+            return
+        self.frame_open = False
+        end = time.perf_counter_ns()
+        totals = {"frame": (end - self.frame_start) / 1e6}
+        for name, start, stop, depth in self.spans:
+            key = (name, depth)
+            totals[key] = totals.get(key, 0.0) + (stop - start) / 1e6
+        self.history.append(totals)
+        self.counts = counts or {}
+
+        if self.tracing:
+            origin = self.trace_origin
+            events = self.trace_events
+            events.append({"name": "frame", "ph": "X", "pid": 0, "tid": 0,
+                           "ts": (self.frame_start - origin) / 1000, "dur": (end - self.frame_start) / 1000})
+            for name, start, stop, depth in self.spans:
+                events.append({"name": name, "ph": "X", "pid": 0, "tid": 0,
+                               "ts": (start - origin) / 1000, "dur": (stop - start) / 1000})
+            if self.counts:
+                events.append({"name": "entities", "ph": "C", "pid": 0, "tid": 0,
+                               "ts": (end - origin) / 1000, "args": dict(self.counts)})
+
+    def averages(self):
+        """
+        Return the mean time per scope over the history, in first-seen order.
+
+        Returns:
+            list: (name, depth, ms) tuples; the frame total has depth -1.
+        """
+        sums = {}
+        for totals in self.history:
+            for key, ms in totals.items():
+                sums[key] = sums.get(key, 0.0) + ms
+        frames = max(len(self.history), 1)
+        rows = []
+        for key, total in sums.items():
+            name, depth = (key, -1) if key == "frame" else key
+            rows.append((name, depth, total / frames))
+        return rows
+
+    def _render_overlay(self):
+        if self.font is None:
+            self.font = fonts.get(20)
+        lines = []
+        for name, depth, ms in self.averages():
+            lines.append(f"{'  ' * (depth + 1)}{name}: {ms:.2f} ms")
+        lines.extend(f"{name}: {count}" for name, count in self.counts.items())
+        lines.extend(f"{name} pool: {stats['hit_rate']:.0%} reused, {stats['live']} live, {stats['free']} free"
+                     for name, stats in pool_stats().items())
+        rendered = [self.font.render(line, True, settings.WHITE) for line in lines]
+        width = max((surface.get_width() for surface in rendered), default=0) + 10
+        height = sum(surface.get_height() for surface in rendered) + 10
+        self.overlay_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.overlay_surface.fill((0, 0, 0, 160))
+        y = 5
+        for surface in rendered:
+            self.overlay_surface.blit(surface, (5, y))
+            y += surface.get_height()
+
+    def draw(self, screen):
+        """
+        Draw the overlay in the top-right corner if it is shown.
+
+        The text is re-rendered every `refresh` milliseconds, not every frame.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+
+        Returns:
+            pygame.Rect: Area drawn, or None if the overlay is hidden.
+        """
+        if not self.overlay:
+            return None
+        now = pygame.time.get_ticks()
+        if self.overlay_surface is None or now - self.overlay_time >= self.refresh:
+            self._render_overlay()
+            self.overlay_time = now
+        return screen.blit(self.overlay_surface, (screen.get_width() - self.overlay_surface.get_width() - 10, 10))
+
+
+profiler = Profiler()
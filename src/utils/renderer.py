@@ -0,0 +1,129 @@
+"""
+Renderer module for Space Fighter game.
+
+This module decides how much of the screen is redrawn and pushed to the
+display each frame. FullRenderer repaints the whole background and flips;
+DirtyRectRenderer only restores and updates the areas that were drawn on
+this frame or the previous one, which is much cheaper on software-rendered
+displays when little of the screen moves.
+"""
+import pygame
+import settings
+
+
+def draw_sprites(surface, sprites):
+    """
+    Draw sprites like `Group.draw`, but return the areas drawn.
+
+    `Group.draw` keeps its rects internally, so it cannot feed dirty rects.
+
+    Args:
+        surface (pygame.Surface): Surface to draw on.
+        sprites (iterable): Sprites with `image` and `rect`.
+
+    Returns:
+        list: Areas that were drawn.
+    """
+    return surface.blits([(sprite.image, sprite.rect) for sprite in sprites])
+
+
+class FullRenderer:
+    """
+    Renderer that repaints the full background and flips every frame.
+    """
+    def __init__(self, screen, background):
+        """
+        Initialize the renderer.
+
+        Args:
+            screen (pygame.Surface): The display surface.
+            background (pygame.Surface): Screen-sized background image.
+        """
+        self.screen = screen
+        self.background = background
+
+    def begin_frame(self, scene):
+        """
+        Prepare the screen for drawing a frame.
+
+        Args:
+            scene (hashable): Identifies what is on screen; unused here.
+        """
+        self.screen.blit(self.background, (0, 0))
+
+    def mark(self, *rects):
+        """Record areas drawn this frame; unused here."""
+
+    def present(self):
+        """Push the frame to the display."""
+        pygame.display.flip()
+
+
+class DirtyRectRenderer(FullRenderer):
+    """
+    Renderer that only restores and updates areas drawn this frame or the last.
+
+    Everything drawn must be reported with `mark`. When the scene changes, or
+    the dirty area grows past a fraction of the screen, it falls back to a
+    full repaint and flip.
+    """
+    def __init__(self, screen, background, threshold=settings.DIRTY_RECT_THRESHOLD):
+        """
+        Initialize the renderer.
+
+        Args:
+            screen (pygame.Surface): The display surface.
+            background (pygame.Surface): Screen-sized background image.
+            threshold (float): Fraction of the screen area above which a
+                full flip is cheaper than a list of rects.
+        """
+        super().__init__(screen, background)
+        self.screen_rect = screen.get_rect()
+        self.max_dirty_area = self.screen_rect.width * self.screen_rect.height * threshold
+        self.scene = None
+        self.previous = []
+        self.current = []
+        self.full = True
+
+    def begin_frame(self, scene):
+        """
+        Erase last frame's drawing by restoring the background under it.
+
+        Args:
+            scene (hashable): Identifies what is on screen, e.g. the game state.
+                A different scene than last frame forces a full repaint.
+        """
+        if scene != self.scene or self.full:
+            self.scene = scene
+            self.full = True
+            self.previous = []
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self.previous:
+                self.screen.blit(self.background, rect, rect)
+        self.current = []
+
+    def mark(self, *rects):
+        """
+        Record areas drawn this frame.
+
+        Args:
+            *rects: pygame.Rect objects, lists of them, or None for nothing drawn.
+        """
+        for rect in rects:
+            if rect is None:
+                continue
+            if isinstance(rect, pygame.Rect):
+                self.current.append(rect.clip(self.screen_rect))
+            else:
+                self.mark(*rect)
+
+    def present(self):
+        """Push the dirty areas, or the whole frame, to the display."""
+        dirty = self.previous + self.current
+        self.previous = self.current
+        if self.full or sum(rect.width * rect.height for rect in dirty) > self.max_dirty_area:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
+        self.full = False
@@ -0,0 +1,233 @@
+"""
+Replay module for Space Fighter game.
+
+This module records the input of a game into a compact binary log and plays
+it back. The simulation runs on a fixed timestep and draws every random
+number from one seeded source, so the seed, the difficulty and the input of
+each frame (with the number of simulation ticks it drove) are enough to
+reproduce a session exactly, with or without rendering.
+
+Log layout (little-endian):
+    header   magic, format version, seed, difficulty, simulation rate
+    frames   frame count, then one fixed-size record per rendered frame
+    summary  sim ticks, score, level and lives at the end, for verification
+"""
+import struct
+import pygame
+import settings
+from src.utils.input import InputState, PressedKeys
+
+MAGIC = b"SFRP"
+VERSION = 2  # Bump when the log layout or the simulation rules change, so old logs are refused
+HEADER = struct.Struct("<4sBIBH")
+COUNT = struct.Struct("<I")
+# Ticks run, held key mask, pressed key mask, mouse x, mouse y, button and quit bits
+FRAME = struct.Struct("<BHHhhB")
+SUMMARY = struct.Struct("<dIII")
+
+# Keys the game reads; bit i of a key mask is KEYS[i]
+KEYS = (
+    pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d,
+    pygame.K_UP, pygame.K_LEFT, pygame.K_DOWN, pygame.K_RIGHT,
+    pygame.K_u, pygame.K_SPACE,
+)
+QUIT_BIT = 1 << 3
+
+
+def _key_mask(keys):
+    mask = 0
+    for bit, key in enumerate(KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def _mask_keys(mask):
+    return PressedKeys(key for bit, key in enumerate(KEYS) if mask & (1 << bit))
+
+
+def encode_frame(state, ticks):
+    """
+    Pack one frame of input.
+
+    Args:
+        state (InputState): The frame's input.
+        ticks (int): Simulation ticks the input drove.
+
+    Returns:
+        bytes: The packed record.
+    """
+    buttons = sum(1 << i for i, pressed in enumerate(state.mouse_buttons[:3]) if pressed)
+    if state.quit:
+        buttons |= QUIT_BIT
+    x, y = state.mouse_pos
+    return FRAME.pack(ticks, _key_mask(state.keys), _key_mask(state.pressed), int(x), int(y), buttons)
+
+
+def decode_frame(data, offset=0):
+    """
+    Unpack one frame of input.
+
+    Args:
+        data (bytes): Buffer holding the record.
+        offset (int): Position of the record in the buffer.
+
+    Returns:
+        tuple: (ticks, InputState).
+    """
+    ticks, held, pressed, x, y, buttons = FRAME.unpack_from(data, offset)
+    mouse_buttons = (bool(buttons & 1), bool(buttons & 2), bool(buttons & 4))
+    return ticks, InputState(_mask_keys(held), (x, y), mouse_buttons, _mask_keys(pressed), bool(buttons & QUIT_BIT))
+
+
+class Recording:
+    """
+    A recorded session: how it started, every frame's input and how it ended.
+    """
+    def __init__(self, seed, difficulty, sim_rate=settings.SIM_RATE, frames=b"", summary=None):
+        """
+        Initialize a recording.
+
+        Args:
+            seed (int): Seed of the game's random source.
+            difficulty (int): Difficulty setting (EASY, NORMAL, HARD).
+            sim_rate (int): Simulation ticks per second it was recorded at.
+            frames (bytes): Packed frame records.
+            summary (tuple): (sim ticks, score, level, lives) at the end.
+        """
+        self.seed = seed
+        self.difficulty = difficulty
+        self.sim_rate = sim_rate
+        self.frames = bytearray(frames)
+        self.summary = summary
+
+    def __len__(self):
+        return len(self.frames) // FRAME.size
+
+    def __iter__(self):
+        for offset in range(0, len(self.frames), FRAME.size):
+            yield decode_frame(self.frames, offset)
+
+    def save(self, path):
+        """
+        Write the recording to a file.
+
+        Args:
+            path (str): Destination path.
+        """
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self.seed, self.difficulty, self.sim_rate))
+            file.write(COUNT.pack(len(self)))
+            file.write(self.frames)
+            file.write(SUMMARY.pack(*self.summary))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a recording from a file.
+
+        Args:
+            path (str): Path written by `save`.
+
+        Returns:
+            Recording: The loaded recording.
+
+        Raises:
+            ValueError: If the file is not a recording this version can read.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        magic, version, seed, difficulty, sim_rate = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a replay")
+        if version != VERSION:
+            raise ValueError(f"{path} is a version {version} replay; this game plays version {VERSION}")
+        offset = HEADER.size
+        (count,) = COUNT.unpack_from(data, offset)
+        offset += COUNT.size
+        frames = data[offset:offset + count * FRAME.size]
+        summary = SUMMARY.unpack_from(data, offset + count * FRAME.size)
+        return cls(seed, difficulty, sim_rate, frames, summary)
+
+
+def summarize(game):
+    """
+    Return the end-of-session values a replay is checked against.
+
+    Args:
+        game (Game): The game.
+
+    Returns:
+        tuple: (sim ticks, score, level, lives).
+    """
+    return (game.sim_clock.ticks, game.score, game.level, max(game.player.lives, 0))
+
+
+class Recorder:
+    """
+    Records a game's input frame by frame; attach with `game.recorder = Recorder(game)`.
+    """
+    def __init__(self, game):
+        """
+        Start a recording of the game in progress.
+
+        Call this right after the game is started, so the seed is current.
+
+        Args:
+            game (Game): The game to record.
+        """
+        self.recording = Recording(game.seed, game.difficulty)
+
+    def record(self, game, state, ticks):
+        """
+        Log one frame of input.
+
+        Args:
+            game (Game): The game being recorded.
+            state (InputState): The frame's input.
+            ticks (int): Simulation ticks the input will drive.
+
+        Returns:
+            InputState: The input as it will read back, which the game must
+                use instead of `state` so replays see exactly the same values.
+        """
+        record = encode_frame(state, ticks)
+        self.recording.frames += record
+        return decode_frame(record)[1]
+
+    def save(self, game, path):
+        """
+        Finish the recording and write it to a file.
+
+        Args:
+            game (Game): The recorded game.
+            path (str): Destination path.
+        """
+        self.recording.summary = summarize(game)
+        self.recording.save(path)
+
+
+class ReplayInput:
+    """
+    Input source that plays back a recording, one frame per poll.
+    """
+    def __init__(self, recording):
+        """
+        Initialize the source.
+
+        Args:
+            recording (Recording): The recording to play back.
+        """
+        self.frames = iter(recording)
+
+    def poll(self, game):
+        """
+        Return the next recorded frame's input.
+
+        Args:
+            game (Game): The game being driven (unused).
+
+        Returns:
+            InputState: The recorded input.
+        """
+        return next(self.frames)[1]
@@ -0,0 +1,117 @@
+"""
+Rotation module for Space Fighter game.
+
+This module provides quantized rotation atlases so sprites that spin freely
+(projectiles, the player ship) are rotated once per angle bucket instead of
+once per shot or per frame.
+"""
+import pygame
+import settings
+
+
+class RotationAtlas:
+    """
+    Lazily built set of pre-rotated copies of a single source surface.
+
+    Angles are snapped to the nearest of `buckets` evenly spaced steps, so a
+    lookup is an index into a list once the frame for that bucket exists.
+    """
+    def __init__(self, source, buckets=settings.ROTATION_BUCKETS, size=None):
+        """
+        Initialize an empty atlas.
+
+        Args:
+            source (callable): Zero-argument function returning the unrotated surface.
+            buckets (int): Number of angle steps covering a full turn.
+            size (tuple): Optional (width, height) each rotated frame is scaled to.
+        """
+        self.source = source
+        self.buckets = buckets
+        self.size = size
+        self.step = 360 / buckets
+        self._frames = [None] * buckets
+        self._offsets = [None] * buckets
+        self._source_size = None
+
+    @property
+    def source_size(self):
+        """(width, height) of the unrotated source surface."""
+        if self._source_size is None:
+            self._source_size = self.source().get_size()
+        return self._source_size
+
+    def index(self, angle):
+        """
+        Return the bucket index for an angle.
+
+        Args:
+            angle (float): Rotation in degrees, counter-clockwise like pygame.transform.rotate.
+
+        Returns:
+            int: Index in the range [0, buckets).
+        """
+        return round(angle / self.step) % self.buckets
+
+    def frame(self, angle):
+        """
+        Return the pre-rotated surface closest to an angle.
+
+        Args:
+            angle (float): Rotation in degrees.
+
+        Returns:
+            pygame.Surface: The shared rotated frame.
+        """
+        return self.frame_at(self.index(angle))
+
+    def frame_at(self, index):
+        """
+        Return the pre-rotated surface for a bucket index.
+
+        Args:
+            index (int): Bucket index from `index`.
+
+        Returns:
+            pygame.Surface: The shared rotated frame.
+        """
+        frame = self._frames[index]
+        if frame is None:
+            frame = self._build(index)
+            self._frames[index] = frame
+        return frame
+
+    def offset_at(self, index):
+        """
+        Return the top-left offset that centres a bucket's frame on a point.
+
+        Args:
+            index (int): Bucket index from `index`.
+
+        Returns:
+            tuple: (dx, dy) to add to the desired centre before blitting.
+        """
+        offset = self._offsets[index]
+        if offset is None:
+            width, height = self.frame_at(index).get_size()
+            offset = (-(width // 2), -(height // 2))
+            self._offsets[index] = offset
+        return offset
+
+    def prebuild(self, progress=None):
+        """
+        Build every frame up front, e.g. behind a loading screen.
+
+        Args:
+            progress (callable): Called as progress(done, total) after each frame.
+        """
+        for index in range(self.buckets):
+            self.frame_at(index)
+            self.offset_at(index)
+            if progress is not None:
+                progress(index + 1, self.buckets)
+
+    def _build(self, index):
+        frame = pygame.transform.rotate(self.source(), index * self.step)
+        if self.size is not None:
+            frame = pygame.transform.scale(frame, self.size)
+        return frame
@@ -0,0 +1,146 @@
+"""
+Spatial hash module for Space Fighter game.
+
+This module provides a uniform-grid broadphase so collision checks only test
+entities that share a grid cell instead of every pair.
+"""
+import math
+import settings
+
+
+class SpatialHash:
+    """
+    Uniform grid mapping cell coordinates to the entities overlapping them.
+
+    Entities are anything with a `rect`. The grid is cheap to clear and refill,
+    so the game rebuilds it once per tick after enemies have moved.
+    """
+    def __init__(self, cell_size=settings.SPATIAL_CELL_SIZE):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size (int): Side length of a square cell in pixels.
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        """Remove every entity from the grid."""
+        self.cells.clear()
+
+    def insert(self, item, rect):
+        """
+        Add an entity to every cell its rect overlaps.
+
+        Args:
+            item: The entity to store.
+            rect (pygame.Rect): The entity's bounding rect.
+        """
+        size = self.cell_size
+        cells = self.cells
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [item]
+                else:
+                    bucket.append(item)
+
+    def rebuild(self, items):
+        """
+        Clear the grid and insert every entity by its current rect.
+
+        Args:
+            items (iterable): Entities with a `rect` attribute, e.g. a sprite group.
+        """
+        self.cells.clear()
+        for item in items:
+            self.insert(item, item.rect)
+
+    def query(self, rect):
+        """
+        Return the entities sharing at least one cell with a rect.
+
+        These are broadphase candidates; callers still run the exact test.
+
+        Args:
+            rect (pygame.Rect): Area to look up.
+
+        Returns:
+            list: Unique candidates in a stable, insertion-based order.
+        """
+        size = self.cell_size
+        cells = self.cells
+        found = {}
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for item in bucket:
+                        found[item] = None
+        return list(found)
+
+    def query_radius(self, position, radius):
+        """
+        Return the entities sharing a cell with a circle's bounding box.
+
+        Args:
+            position (Vector2): Centre of the circle.
+            radius (float): Radius of the circle.
+
+        Returns:
+            list: Unique broadphase candidates.
+        """
+        size = self.cell_size
+        cells = self.cells
+        found = {}
+        for cx in range(int((position.x - radius) // size), int((position.x + radius) // size) + 1):
+            for cy in range(int((position.y - radius) // size), int((position.y + radius) // size) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for item in bucket:
+                        found[item] = None
+        return list(found)
+
+    def query_segment(self, start, end):
+        """
+        Return the entities in every cell a line segment passes through.
+
+        Walks the grid cell by cell along the segment, so a diagonal beam only
+        visits the cells it crosses rather than its whole bounding box.
+
+        Args:
+            start (Vector2): Segment start point.
+            end (Vector2): Segment end point.
+
+        Returns:
+            list: Unique broadphase candidates.
+        """
+        size = self.cell_size
+        cells = self.cells
+        x0, y0 = start.x / size, start.y / size
+        x1, y1 = end.x / size, end.y / size
+        cx, cy = math.floor(x0), math.floor(y0)
+        dx, dy = x1 - x0, y1 - y0
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        t_delta_x = abs(1 / dx) if dx else math.inf
+        t_delta_y = abs(1 / dy) if dy else math.inf
+        t_max_x = ((cx + 1 - x0) if dx > 0 else (x0 - cx)) * t_delta_x if dx else math.inf
+        t_max_y = ((cy + 1 - y0) if dy > 0 else (y0 - cy)) * t_delta_y if dy else math.inf
+        steps = abs(math.floor(x1) - cx) + abs(math.floor(y1) - cy)
+
+        found = {}
+        for _ in range(steps + 1):
+            bucket = cells.get((cx, cy))
+            if bucket:
+                for item in bucket:
+                    found[item] = None
+            if t_max_x < t_max_y:
+                cx += step_x
+                t_max_x += t_delta_x
+            else:
+                cy += step_y
+                t_max_y += t_delta_y
+        return list(found)
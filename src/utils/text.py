@@ -0,0 +1,101 @@
+"""
+Text module for Space Fighter game.
+
+This module caches rendered text surfaces keyed by (string, colour, font),
+along with pre-faded copies, so frequently repeated labels such as damage
+numbers are rendered once instead of every frame.
+"""
+from collections import OrderedDict
+import settings
+
+
+class TextCache:
+    """
+    Least-recently-used cache of rendered text and fade ramps.
+
+    Cached surfaces are shared and must be treated as read-only.
+    """
+    def __init__(self, max_entries=settings.TEXT_CACHE_SIZE, fade_steps=settings.TEXT_FADE_STEPS):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of cached strings per table.
+            fade_steps (int): Number of alpha levels in a fade ramp.
+        """
+        self.max_entries = max_entries
+        self.fade_steps = fade_steps
+        self._surfaces = OrderedDict()
+        self._ramps = OrderedDict()
+
+    def render(self, font, text, color):
+        """
+        Return an antialiased rendering of a string.
+
+        Args:
+            font (pygame.font.Font): Font to render with.
+            text (str): The string to render.
+            color (tuple): RGB text colour.
+
+        Returns:
+            pygame.Surface: The shared rendered text.
+        """
+        key = (text, color, font)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._store(self._surfaces, key, surface)
+        else:
+            self._surfaces.move_to_end(key)
+        return surface
+
+    def fade_ramp(self, font, text, color):
+        """
+        Return copies of a rendered string from fully opaque to nearly invisible.
+
+        Index 0 is opaque; the last entry has the lowest alpha.
+
+        Args:
+            font (pygame.font.Font): Font to render with.
+            text (str): The string to render.
+            color (tuple): RGB text colour.
+
+        Returns:
+            list: `fade_steps` shared surfaces with decreasing alpha.
+        """
+        key = (text, color, font)
+        ramp = self._ramps.get(key)
+        if ramp is None:
+            text_surface = self.render(font, text, color)
+            ramp = []
+            for step in range(self.fade_steps):
+                frame = text_surface.copy()
+                frame.set_alpha(round(255 * (1 - step / self.fade_steps)))
+                ramp.append(frame)
+            self._store(self._ramps, key, ramp)
+        else:
+            self._ramps.move_to_end(key)
+        return ramp
+
+    def _store(self, table, key, value):
+        table[key] = value
+        if len(table) > self.max_entries:
+            table.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached surface."""
+        self._surfaces.clear()
+        self._ramps.clear()
+
+
+cache = TextCache()
+
+
+def render(font, text, color):
+    """Return a cached rendering of a string."""
+    return cache.render(font, text, color)
+
+
+def fade_ramp(font, text, color):
+    """Return a cached fade ramp for a string."""
+    return cache.fade_ramp(font, text, color)
@@ -3,10 +3,12 @@ import random
 import settings
 from pygame.math import Vector2
 import src.entities.weapons as weapons
+import src.utils.assets as assets
+import src.utils.fonts as fonts
 
 upgrade_cache = []
 
-def apply_upgrade(player, upgrade_type):
+def apply_upgrade(player, upgrade_type, hud=None):
     upgrade = settings.UPGRADES.get(upgrade_type)
     if not upgrade:
         return False
@@ -23,52 +25,115 @@ def apply_upgrade(player, upgrade_type):
         player.shoot_delay = max(100, player.shoot_delay - 50)
     elif upgrade_type == "speed":
         player.base_acceleration += 20
+        player.acceleration.update(player.base_acceleration, player.base_acceleration)
     elif upgrade_type == "health":
         player.lives += 1
+        if hud is not None:
+            hud.set_lives(player.lives)
     elif upgrade_type == "damage":
         pass
     elif upgrade_type == "sniper":
-        player.weapon = weapons.Weapon_sniper()
+        player.weapon = weapons.Weapon_sniper(player.clock, player.rng)
     elif upgrade_type == "laser":
-        player.weapon = weapons.Weapon_laser()
+        player.weapon = weapons.Weapon_laser(player.clock, player.rng)
     elif upgrade_type == "shotgun":
-        player.weapon = weapons.Weapon_shotgun()
+        player.weapon = weapons.Weapon_shotgun(player.clock, player.rng)
     return True
 
-def draw_upgrade_menu(screen, player):
-    global upgrade_cache
-
+def _build_overlay():
     overlay = pygame.Surface(settings.SCREEN_SIZE, pygame.SRCALPHA)
     overlay.fill((0, 0, 0, 180))
-    screen.blit(overlay, (0, 0))
-    
-    bg = pygame.image.load("assets/upgrade-bg.png").convert_alpha()
-    bg = pygame.transform.scale(bg, settings.SCREEN_SIZE)
-    screen.blit(bg, (0, 0))
+    return overlay
+
+BOX_SIZE = 100
+PADDING = 40
+MENU_Y = 300
+ICON_SIZE = (BOX_SIZE - 20, BOX_SIZE - 20)
+
+ICONS = {
+    "fire_rate": "upgrade-rate.png",
+    "speed": "upgrade-speed.png",
+    "health": "upgrade-health.png",
+    "damage": "upgrade-dmg.png",
+    "sniper": "weapon_sniper.png",
+    "shotgun": "weapon_shotgun.png",
+    "laser": "weapon_laser.png",
+}
+SELECTION_ICON = "upgrade-sel.png"
+
+def upgrade_choices(rng=random):
+    """
+    Return the upgrades currently offered, rolling a new set if none are.
+
+    Args:
+        rng (random.Random): Random source for rolling a new set.
+
+    Returns:
+        list: Upgrade type names, left to right.
+    """
+    global upgrade_cache
 
-    font = pygame.font.Font(None, 36)
-    small_font = pygame.font.Font(None, 24)
-    
     all_upgrade_types = ["fire_rate", "speed", "health", "damage"]
     weapon_upgrades = ["sniper", "shotgun", "laser"]
     #new_weapon = bool(round(random.random()/2))
     new_weapon = 1
     if not upgrade_cache:
         if new_weapon:
-            upgrade_cache = random.sample(all_upgrade_types, 2) + random.sample(weapon_upgrades, 1) 
+            upgrade_cache = rng.sample(all_upgrade_types, 2) + rng.sample(weapon_upgrades, 1) 
         else:
-            upgrade_cache = random.sample(all_upgrade_types, 3)
+            upgrade_cache = rng.sample(all_upgrade_types, 3)
+    return upgrade_cache
+
+def clear_choices():
+    """Forget the offered upgrades so the next menu rolls a new set."""
+    global upgrade_cache
+    upgrade_cache = []
+
+def choice_rects(choices):
+    """
+    Return the clickable box of each offered upgrade.
+
+    Args:
+        choices (list): Upgrade type names, as returned by upgrade_choices.
+
+    Returns:
+        list: pygame.Rect per choice, in the same order.
+    """
+    start_x = (settings.SCREEN_SIZE[0] - (len(choices) * (BOX_SIZE + PADDING) - PADDING)) // 2
+    return [pygame.Rect(start_x + idx * (BOX_SIZE + PADDING), MENU_Y, BOX_SIZE, BOX_SIZE)
+            for idx in range(len(choices))]
+
+def choose_upgrade(player, mouse_pos, hud=None):
+    """
+    Apply the offered upgrade under a click, if any.
+
+    Args:
+        player (Player): The player to upgrade.
+        mouse_pos (tuple): Click position.
+        hud (Hud): HUD to notify of changed values.
+
+    Returns:
+        bool: True if an upgrade was applied and the menu should close.
+    """
+    global upgrade_cache
+
+    choices = upgrade_choices()
+    for upgrade_type, rect in zip(choices, choice_rects(choices)):
+        if rect.collidepoint(mouse_pos):
+            if apply_upgrade(player, upgrade_type, hud):
+                upgrade_cache = []
+                return True
+    return False
+
+def draw_upgrade_menu(screen, player, mouse_pos):
+    overlay = assets.variant("upgrade-overlay", _build_overlay)
+    screen.blit(overlay, (0, 0))
     
+    bg = assets.get("upgrade-bg.png", settings.SCREEN_SIZE)
+    screen.blit(bg, (0, 0))
 
-    icons = {
-        "fire_rate": pygame.image.load("assets/upgrade-rate.png"),
-        "speed": pygame.image.load("assets/upgrade-speed.png"),
-        "health": pygame.image.load("assets/upgrade-health.png"),
-        "damage": pygame.image.load("assets/upgrade-dmg.png"),
-        "sniper": pygame.image.load("assets/weapon_sniper.png"),
-        "shotgun": pygame.image.load("assets/weapon_shotgun.png"),
-        "laser": pygame.image.load("assets/weapon_laser.png"),
-    }
+    font = fonts.get(36)
+    small_font = fonts.get(24)
 
     descriptions = {
         "fire_rate": "+50% fire rate",
@@ -80,25 +145,16 @@ def draw_upgrade_menu(screen, player):
         "shotgun": "shotgun weapon",
     }
 
-    box_size = 100
-    padding = 40
-    start_x = (settings.SCREEN_SIZE[0] - (len(upgrade_cache) * (box_size + padding) - padding)) // 2
-    y = 300
+    box_size = BOX_SIZE
+    choices = upgrade_choices()
+    for upgrade_type, rect in zip(choices, choice_rects(choices)):
+        x, y = rect.topleft
 
-    mouse_pos = pygame.mouse.get_pos()
-    mouse_clicked = pygame.mouse.get_pressed()[0]
-
-    for idx, upgrade_type in enumerate(upgrade_cache):
-        x = start_x + idx * (box_size + padding)
-        rect = pygame.Rect(x, y, box_size, box_size)
-
-        icon = pygame.transform.scale(icons[upgrade_type], (box_size - 20, box_size - 20))
+        icon = assets.get(ICONS[upgrade_type], ICON_SIZE)
         screen.blit(icon, (x + 10, y + 10))
 
-        hovered = rect.collidepoint(mouse_pos)
         if rect.collidepoint(mouse_pos):
-            selection_overlay = pygame.image.load("assets/upgrade-sel.png")
-            selection_overlay = pygame.transform.scale(selection_overlay, (box_size - 20, box_size - 20))
+            selection_overlay = assets.get(SELECTION_ICON, ICON_SIZE)
             screen.blit(selection_overlay, (x + 10, y + 10))
 
         level = player.upgrades.get(upgrade_type, 0)
@@ -115,10 +171,3 @@ def draw_upgrade_menu(screen, player):
         desc_text = small_font.render(descriptions[upgrade_type], True, settings.WHITE)
         desc_rect = desc_text.get_rect(center=(x + box_size // 2, y + box_size + 80))
         screen.blit(desc_text, desc_rect)
-
-        if hovered and mouse_clicked:
-            if apply_upgrade(player, upgrade_type):
-                upgrade_cache = []
-                return True
-    return False 
-
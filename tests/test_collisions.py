@@ -0,0 +1,71 @@
+"""
+Collision tests for Space Fighter game.
+
+Run from the project root with `python -m pytest`.
+"""
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pytest
+from main import Game
+import settings
+from src.entities.bullet import Bullet_sniper
+from src.entities.enemy import spawn
+
+TICK = settings.SIM_DT
+
+
+@pytest.fixture(scope="module")
+def game():
+    game = Game(headless=True)
+    yield game
+    game.running = False
+
+
+def place(game, name, x, y, health=1000):
+    """Spawn a stationary enemy at (x, y) with the given health."""
+    enemy = spawn(name, settings.SCREEN_SIZE[0], game.player, game.difficulty, rng=game.rng)
+    enemy.position.update(x, y)
+    enemy.rect.center = enemy.position
+    enemy.health = enemy.max_health = health
+    game.enemies.add(enemy)
+    return enemy
+
+
+def fire(game, x, y):
+    """Fire a sniper bullet to the right from (x, y)."""
+    game.player.projectiles.emit(Bullet_sniper, (x, y), 0, 2, 0)
+
+
+def fly(game, ticks=60):
+    """Move projectiles and resolve their hits without moving the enemies."""
+    projectiles = game.player.projectiles
+    for _ in range(ticks):
+        projectiles.update(TICK, 0)
+        game.check_projectile_collisions()
+
+
+def test_pierce_hits_each_enemy_once(game):
+    game.start(settings.NORMAL, seed=1)
+    enemies = [place(game, "chaser", x, 300) for x in (300, 340, 500)]
+    fire(game, 200, 300)
+    fly(game)
+    damage = Bullet_sniper.damage
+    assert [enemy.max_health - enemy.health for enemy in enemies] == [damage] * 3
+
+
+def test_pooled_enemy_is_not_skipped(game):
+    game.start(settings.NORMAL, seed=1)
+    first = place(game, "chaser", 300, 300, health=0.1)
+    fire(game, 200, 300)
+    fly(game, ticks=2)
+    assert not first.alive()
+
+    # The pool hands the killed enemy's object to the next spawn
+    second = place(game, "chaser", 500, 300)
+    assert second is first
+    fly(game)
+    assert second.health < second.max_health
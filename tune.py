@@ -0,0 +1,163 @@
+"""
+Difficulty tuning runner for Space Fighter game.
+
+Plays many headless games in parallel across a grid of difficulty
+parameters and reports survival time, score, level reached and simulation
+throughput for each combination. Uses every core by default.
+
+Grid axes are `--grid NAME=V1,V2,...`, where NAME is a field of the chosen
+difficulty's DIFFICULTY_SETTINGS entry (enemy_speed, enemy_health,
+score_multiplier) or one of the settings in TUNABLE. Game i of every
+combination uses the same seed, so combinations face the same games.
+
+Example:
+    python tune.py --grid enemy_speed=150,200,250 --grid LEVEL_UP_SCORE=20,40 --games 32 --minutes 5
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import itertools
+import json
+import os
+import random
+import statistics
+import time
+import settings
+
+TUNABLE = ("LEVEL_UP_SCORE", "SPAWN_DELAY", "SPAWN_DELAY_2", "SPAWN_DELAY_STEP", "MIN_SPAWN_DELAY")
+DIFFICULTY_FIELDS = ("enemy_speed", "enemy_health", "score_multiplier")
+DIFFICULTIES = {"easy": settings.EASY, "normal": settings.NORMAL, "hard": settings.HARD}
+
+_game = None  # One headless Game per worker process, reused for every job
+
+
+def _apply(overrides, difficulty):
+    """Apply overrides to this process's settings; return a function undoing them."""
+    saved = {name: getattr(settings, name) for name in TUNABLE}
+    saved_difficulty = copy.deepcopy(settings.DIFFICULTY_SETTINGS)
+    for name, value in overrides.items():
+        if name in DIFFICULTY_FIELDS:
+            settings.DIFFICULTY_SETTINGS[difficulty][name] = value
+        else:
+            setattr(settings, name, value)
+
+    def restore():
+        for name, value in saved.items():
+            setattr(settings, name, value)
+        settings.DIFFICULTY_SETTINGS.clear()
+        settings.DIFFICULTY_SETTINGS.update(saved_difficulty)
+    return restore
+
+
+def run_job(job):
+    """
+    Play one game in a worker process.
+
+    Args:
+        job (dict): Overrides, difficulty, policy, seed and length in seconds.
+
+    Returns:
+        dict: The game's simulate() summary plus the wall time it took.
+    """
+    global _game
+    from main import Game
+    from src.entities.enemy import registry
+    from src.utils.input import ScriptedInput
+    from src.utils.policies import RandomPolicy, idle_policy
+
+    if _game is None:
+        _game = Game(headless=True)
+    restore = _apply(job["overrides"], job["difficulty"])
+    registry.clear()  # Enemy templates precompute stats from DIFFICULTY_SETTINGS
+    try:
+        policy = idle_policy if job["policy"] == "idle" else RandomPolicy(random.Random(job["seed"]))
+        _game.input_source = ScriptedInput(policy)
+        _game.start(job["difficulty"], job["seed"])
+        started = time.perf_counter()
+        result = _game.simulate(job["seconds"])
+        result["wall"] = time.perf_counter() - started
+    finally:
+        restore()
+        registry.clear()
+    return result
+
+
+def parse_axis(text):
+    name, _, values = text.partition("=")
+    if name not in TUNABLE + DIFFICULTY_FIELDS or not values:
+        raise argparse.ArgumentTypeError(f"expected NAME=V1,V2 with NAME in {', '.join(TUNABLE + DIFFICULTY_FIELDS)}")
+    return name, [float(value) if "." in value else int(value) for value in values.split(",")]
+
+
+def summarize(values):
+    ordered = sorted(values)
+    return {
+        "mean": statistics.fmean(ordered),
+        "median": statistics.median(ordered),
+        "p10": ordered[int(len(ordered) * 0.1)],
+        "p90": ordered[min(int(len(ordered) * 0.9), len(ordered) - 1)],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--grid", type=parse_axis, action="append", default=[], help="axis NAME=V1,V2 (repeatable)")
+    parser.add_argument("--difficulty", choices=DIFFICULTIES, action="append", help="difficulties to run (repeatable)")
+    parser.add_argument("--policy", choices=("random", "idle"), default="random")
+    parser.add_argument("--games", type=int, default=16, help="games per combination")
+    length = parser.add_mutually_exclusive_group()
+    length.add_argument("--seconds", type=float, default=120, help="simulated seconds per game at most")
+    length.add_argument("--minutes", type=float, help="simulated minutes per game at most")
+    parser.add_argument("--seed", type=int, default=0, help="base seed")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--output", help="also write the report as JSON here")
+    args = parser.parse_args()
+    seconds = args.minutes * 60 if args.minutes is not None else args.seconds
+
+    names = [name for name, _ in args.grid]
+    combos = [dict(zip(names, values)) for values in itertools.product(*(values for _, values in args.grid))]
+    difficulties = args.difficulty or ["normal"]
+    jobs = []
+    for difficulty in difficulties:
+        for combo in combos:
+            for game in range(args.games):
+                seed = random.Random(f"{args.seed}-{difficulty}-{game}").randrange(2**32)
+                jobs.append({"overrides": combo, "difficulty": DIFFICULTIES[difficulty], "policy": args.policy,
+                             "seed": seed, "seconds": seconds})
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        results = list(executor.map(run_job, jobs, chunksize=max(1, len(jobs) // (args.workers * 4))))
+    elapsed = time.perf_counter() - started
+
+    report = []
+    for index, (difficulty, combo) in enumerate(itertools.product(difficulties, combos)):
+        games = results[index * args.games:(index + 1) * args.games]
+        simulated = sum(game["survived"] for game in games)
+        report.append({
+            "difficulty": difficulty,
+            "overrides": combo,
+            "games": len(games),
+            "survived": summarize([game["survived"] for game in games]),
+            "score": summarize([game["score"] for game in games]),
+            "level": summarize([game["level"] for game in games]),
+            "game_over_rate": sum(game["game_over"] for game in games) / len(games),
+            "sim_speed": simulated / max(sum(game["wall"] for game in games), 1e-9),
+        })
+
+    for row in report:
+        label = " ".join(f"{name}={value}" for name, value in row["overrides"].items()) or "defaults"
+        print(f"{row['difficulty']:>6} {label}: survived {row['survived']['median']:.1f}s "
+              f"score {row['score']['median']:.0f} level {row['level']['median']:.0f} "
+              f"game over {row['game_over_rate']:.0%} ({row['sim_speed']:.0f}x real time per worker)")
+    total = sum(game["survived"] for game in results)
+    print(f"{len(jobs)} games, {total / 60:.1f} simulated minutes in {elapsed:.1f}s on {args.workers} workers "
+          f"({total / elapsed:.0f}x real time)")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"seconds": seconds, "policy": args.policy, "seed": args.seed, "results": report}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()